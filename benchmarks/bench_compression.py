@@ -0,0 +1,53 @@
+"""Benchmark precompressed page variants against per-request compression.
+
+Compares serving a category page through the app (precompressed variants
+cached per data version) with compressing the same page on every request,
+as Starlette's GZipMiddleware would.
+
+Usage: python benchmarks/bench_compression.py [--category standard] [--requests 200]
+"""
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import main
+from starlette.testclient import TestClient
+
+
+def per_request(n, fn):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--category", default="standard")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    client = TestClient(main.app)
+    url = f"/?category={args.category}"
+    page = client.get(url, headers={"accept-encoding": "identity"}).content
+    print(f"{url}: {len(page)} bytes uncompressed")
+
+    for encoding in main.PAGE_ENCODINGS:
+        body = client.get(url, headers={"accept-encoding": encoding}).headers["content-length"]
+        print(f"  {encoding:<5} precompressed  {int(body):>7} bytes")
+    print(f"  gzip  middleware     {len(gzip.compress(page, 9)):>7} bytes")
+
+    # CPU per request spent on compression alone
+    on_the_fly = per_request(args.requests, lambda: gzip.compress(page, 9))
+    served = per_request(args.requests, lambda: client.get(url, headers={"accept-encoding": "gzip"}))
+    identity = per_request(args.requests, lambda: client.get(url, headers={"accept-encoding": "identity"}))
+    print(f"  gzip per request (compress only)   {on_the_fly:7.3f} ms")
+    print(f"  full request, precompressed gzip   {served:7.3f} ms")
+    print(f"  full request, identity             {identity:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main_()
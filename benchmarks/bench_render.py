@@ -0,0 +1,123 @@
+"""Benchmark leaderboard row rendering: df.iterrows() vs precomputed columns.
+
+Usage: python benchmarks/bench_render.py [--riders 10000] [--races 20] [--repeat 3]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import main
+from main import Span, Strong, Td, Tr, to_xml, create_position_badge
+
+
+def synthetic_category(riders, races, seed=0):
+    """Build a category frame shaped like the results CSVs"""
+    rng = np.random.default_rng(seed)
+    race_names = [f"Race_round_{i:02d}" for i in range(races)]
+    points = rng.choice([0, 0, 0, 1, 5, 10, 15, 20, 22, 25], size=(riders, races)).astype(float)
+    points[rng.random((riders, races)) < 0.2] = np.nan
+    total = np.nan_to_num(points).sum(axis=1)
+    order = np.argsort(-total, kind="stable")
+    dropped = np.where(rng.random(riders) < 0.3, rng.integers(1, 20, riders).astype(float), np.nan)
+    df = pd.DataFrame({
+        "FinalPosition": np.arange(1, riders + 1),
+        "RaceNumber": rng.integers(1, 999, riders),
+        "FirstName": rng.choice(["Димитър", "Иван", "Георги", "Петър"], riders),
+        "LastName": rng.choice(["ТИНЧЕВ", "ИЛИЕВ", "ТОДОРОВ", "ИВАНОВ"], riders),
+        "TotalPoints": total[order],
+        "RacesParticipated": (~np.isnan(points)).sum(axis=1)[order],
+        "BestPosition": rng.integers(1, 30, riders),
+        "WorstResultDropped": dropped,
+        "WorstRace": np.where(np.isnan(dropped), None, rng.choice(race_names, riders)),
+    })
+    for i, name in enumerate(race_names):
+        df[name] = points[order, i]
+    return df
+
+
+def iterrows_rows(df, race_cols):
+    """The original df.iterrows() row builder, kept here as the baseline.
+
+    Rows carry the place ids (lb-row-N) that live updates added since.
+    """
+    rows = []
+    for place, (_, row) in enumerate(df.iterrows(), start=1):
+        worst_dropped = row.get('WorstResultDropped', '')
+        if pd.isna(worst_dropped) or worst_dropped == '':
+            worst_dropped_display = "—"
+            worst_dropped_class = "text-slate-500"
+        else:
+            worst_dropped_display = f"{float(worst_dropped):.0f}"
+            worst_dropped_class = "text-red-400"
+
+        worst_race = row.get('WorstRace', '')
+        if pd.isna(worst_race) or worst_race == '':
+            worst_race_display = "—"
+            worst_race_class = "text-slate-500"
+        else:
+            worst_race_display = str(worst_race).replace('_', ' ').title()
+            worst_race_class = "text-red-400 text-xs"
+
+        cells = [
+            Td(create_position_badge(int(row['FinalPosition'])), cls="text-center px-3 py-4"),
+            Td(Strong(str(int(row['RaceNumber']))), cls="px-3 py-4 font-bold text-slate-200"),
+            Td(f"{row['FirstName']} {row['LastName']}", cls="px-3 py-4 text-slate-200 min-w-[150px]"),
+            Td(
+                Span(f"{row['TotalPoints']:.0f}", cls="px-3 py-1 gradient-bg rounded-full font-bold text-sm text-white"),
+                cls="text-center px-3 py-4"
+            ),
+            Td(str(int(row['RacesParticipated'])), cls="text-center px-3 py-4 text-slate-300"),
+            Td(str(int(row['BestPosition'])), cls="text-center px-3 py-4 text-slate-300"),
+            Td(worst_dropped_display, cls=f"text-center px-3 py-4 {worst_dropped_class} font-semibold"),
+            Td(worst_race_display, cls=f"text-center px-3 py-4 {worst_race_class}"),
+        ]
+        for race_col in race_cols:
+            score = row[race_col]
+            if pd.isna(score) or score == 0:
+                cells.append(Td("—", cls="text-center px-3 py-4 text-slate-500"))
+            elif score >= 25:
+                cells.append(Td(Span(f"{score:.0f}", cls="px-2 py-1 bg-green-500/10 text-green-400 rounded font-semibold text-sm"), cls="text-center px-3 py-4"))
+            else:
+                cells.append(Td(Span(f"{score:.0f}", cls="px-2 py-1 bg-blue-500/10 text-blue-400 rounded text-sm"), cls="text-center px-3 py-4"))
+        rows.append(Tr(*cells, id=f"lb-row-{place}", cls="border-b border-slate-700/50 hover:bg-blue-500/5 transition-colors duration-200"))
+    return rows
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--riders", type=int, default=10_000)
+    parser.add_argument("--races", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_category(args.riders, args.races)
+    race_cols = main.get_race_columns(df)
+    print(f"Synthetic category: {args.riders} riders x {args.races} races")
+
+    t_old, old_html = timed(lambda: "".join(to_xml(row) for row in iterrows_rows(df, race_cols)), 1)
+    t_cols, _ = timed(lambda: main.leaderboard_display_columns(df, race_cols), args.repeat)
+    t_new, new_html = timed(lambda: to_xml(main.create_leaderboard_table(df, "expert")), args.repeat)
+    print(f"  iterrows rows + to_xml       {t_old * 1000:10.1f} ms")
+    print(f"  vectorized table + to_xml    {t_new * 1000:10.1f} ms  ({t_old / t_new:.0f}x faster)")
+    print(f"    of which display columns   {t_cols * 1000:10.1f} ms")
+
+    # Both paths must produce the same rows (whitespace aside)
+    same = "".join(old_html.split()) in "".join(new_html.split())
+    print(f"  identical row markup: {same}")
+
+if __name__ == "__main__":
+    main_()
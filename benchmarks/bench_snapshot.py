@@ -0,0 +1,49 @@
+"""Benchmark loading a category: pd.read_csv vs the memory-mapped columnar snapshot.
+
+Usage: python benchmarks/bench_snapshot.py [--riders 10000] [--races 20] [--repeat 20]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import ColumnarSnapshots, pd
+from bench_render import synthetic_category
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--riders", type=int, default=10000)
+    parser.add_argument("--races", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "bench.csv"
+        synthetic_category(args.riders, args.races).to_csv(csv_path, index=False)
+        raw = csv_path.read_bytes()
+        snapshots = ColumnarSnapshots(Path(tmp) / "snapshots")
+        snapshots.load_or_build("bench", "v1", raw)
+
+        csv_time = best_of(args.repeat, lambda: pd.read_csv(csv_path))
+        snapshot_time = best_of(args.repeat, lambda: snapshots.load("bench", "v1"))
+        assert snapshots.load("bench", "v1").equals(pd.read_csv(csv_path))
+
+    print(f"{args.riders} riders x {args.races} races ({len(raw) / 1024:.0f} KB of CSV)")
+    print(f"  pd.read_csv          {csv_time * 1000:8.2f} ms")
+    print(f"  mmap'd snapshot      {snapshot_time * 1000:8.2f} ms  ({csv_time / snapshot_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,92 @@
+"""Benchmark computing championship standings from per-race results.
+
+Builds a synthetic season of per-race finishing results and times
+compute_standings() scoring and ranking every category in one pass. Also
+checks update_standings(): re-applying a race unchanged must change
+nothing, and a correction must match a full recompute.
+
+Usage: python benchmarks/bench_standings.py [--riders 50000] [--races 7] [--categories 8] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import compute_standings, update_standings
+
+
+def synthetic_results(riders, races, categories, seed=0):
+    """One row per rider start, shaped like a season's races/*.csv files"""
+    rng = np.random.default_rng(seed)
+    category = rng.integers(0, categories, riders)
+    frames = []
+    for race in range(races):
+        # Roughly 70% of riders start each round; 5% of starters aren't classified
+        starters = np.flatnonzero(rng.random(riders) < 0.7)
+        shuffled = rng.permutation(starters)
+        position = np.empty(len(shuffled))
+        for c in range(categories):
+            in_category = category[shuffled] == c
+            position[in_category] = np.arange(1, in_category.sum() + 1)
+        position[rng.random(len(shuffled)) < 0.05] = np.nan
+        frames.append(pd.DataFrame({
+            "Category": np.char.add("category_", category[shuffled].astype(str)),
+            "Position": position,
+            "RaceNumber": shuffled + 1,
+            "FirstName": "Rider",
+            "LastName": np.char.add("NUMBER", (shuffled + 1).astype(str)),
+            "Race": f"round_{race:02d}",
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def check_incremental(results, race="round_02"):
+    """Re-apply one race's results unchanged, then a reshuffled correction, for one category"""
+    category = results["Category"].iloc[0]
+    rounds = results["Race"].nunique()
+    in_category = results["Category"] == category
+    history = results[in_category & (results["Race"] != race)]
+    previous = results[in_category & (results["Race"] == race)].drop(columns="Race")
+    frame = compute_standings(results)[category]
+
+    same, riders = update_standings(frame, rounds, race, previous, previous, history)
+    assert riders == 0 and same is frame, f"re-applying {race} unchanged moved {riders} riders"
+
+    corrected = results.copy()
+    rows = in_category & (corrected["Race"] == race)
+    corrected.loc[rows, "Position"] = np.random.default_rng(1).permutation(corrected.loc[rows, "Position"].to_numpy())
+    updated, riders = update_standings(frame, rounds, race, corrected[rows].drop(columns="Race"), previous, history)
+    expected = compute_standings(corrected)[category]
+    pd.testing.assert_frame_equal(updated[expected.columns], expected, check_dtype=False)
+    return riders
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--riders", type=int, default=50000)
+    parser.add_argument("--races", type=int, default=7)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = synthetic_results(args.riders, args.races, args.categories)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        standings = compute_standings(results)
+        timings.append(time.perf_counter() - start)
+
+    corrected = check_incremental(results)
+    ranked = sum(len(frame) for frame in standings.values())
+    print(f"{args.riders} riders, {args.races} races, {args.categories} categories ({len(results)} result rows)")
+    print(f"  riders ranked        {ranked}")
+    print(f"  update_standings     re-apply unchanged: no change; correction: {corrected} riders, matches full")
+    print(f"  compute_standings    best {min(timings) * 1000:.1f} ms, median {sorted(timings)[len(timings) // 2] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,134 @@
+"""Load test for visit writes under gunicorn with multiple uvicorn workers.
+
+Starts `gunicorn main:app` against a throwaway visits database, drives an
+open-loop request stream at a fixed rate against pages that record a visit,
+then stops the server (flushing the write-behind queues) and checks every
+successful request produced exactly one visit row.
+
+Requires gunicorn and httpx.
+Usage: python benchmarks/load_visits.py [--workers 4] [--rate 1000] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+PAGES = ["/?category=expert", "/?category=standard", "/?category=women", "/stats"]
+AGENTS = ["Mozilla/5.0 (iPhone; CPU iPhone OS 17_0)", "Mozilla/5.0 (X11; Linux x86_64)", ""]
+
+
+def start_server(port, workers, db_path):
+    env = dict(os.environ, VISITS_DB_PATH=str(db_path))
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "main:app", "-w", str(workers),
+         "-k", "uvicorn.workers.UvicornWorker", "--bind", f"127.0.0.1:{port}",
+         "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+
+
+def wait_ready(base_url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def drive(base_url, rate, duration, concurrency):
+    """Send rate*duration requests on a fixed schedule; returns (latencies, failures, elapsed)"""
+    latencies, failures = [], Counter()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    sem = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def one(i):
+            async with sem:
+                start = time.perf_counter()
+                try:
+                    r = await client.get(PAGES[i % len(PAGES)], headers={"user-agent": AGENTS[i % len(AGENTS)]})
+                    error = None if r.status_code == 200 else f"HTTP {r.status_code}"
+                except httpx.HTTPError as e:
+                    error = type(e).__name__
+                latencies.append(time.perf_counter() - start)
+                if error:
+                    failures[error] += 1
+
+        tasks = []
+        t0 = time.perf_counter()
+        for i in range(int(rate * duration)):
+            delay = t0 + i / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(one(i)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - t0
+    return latencies, failures, elapsed
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main_():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rate", type=int, default=1000, help="Requests per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--port", type=int, default=5099)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "visits.db"
+        # Importing main opens VISITS_DB_PATH, so point it at the throwaway
+        # database first; counts are then read with the app's own settings
+        os.environ["VISITS_DB_PATH"] = str(db_path)
+        from main import open_db
+        base_url = f"http://127.0.0.1:{args.port}"
+        server = start_server(args.port, args.workers, db_path)
+        try:
+            wait_ready(base_url)
+            # /health doesn't record visits, so the table only holds load-test rows
+            latencies, failures, elapsed = asyncio.run(
+                drive(base_url, args.rate, args.duration, args.concurrency)
+            )
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(60)
+
+        conn = open_db(db_path).conn
+        try:
+            visits = conn.execute("SELECT COUNT(*) FROM visit").fetchone()[0]
+        finally:
+            conn.close()
+
+    sent = len(latencies)
+    errors = sum(failures.values())
+    succeeded = sent - errors
+    lost = max(succeeded - visits, 0)
+    print(f"{args.workers} workers, target {args.rate} req/s for {args.duration:.0f}s")
+    print(f"  requests sent        {sent} ({sent / elapsed:.0f} req/s achieved)")
+    print(f"  request errors       {errors} ({errors / sent:.2%}) {dict(failures) or ''}")
+    print(f"  latency p50 / p99    {percentile(latencies, 0.5) * 1000:.1f} / {percentile(latencies, 0.99) * 1000:.1f} ms")
+    print(f"  visits written       {visits} of {succeeded}")
+    print(f"  visit write errors   {lost} ({lost / max(succeeded, 1):.2%})")
+
+
+if __name__ == "__main__":
+    main_()
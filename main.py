@@ -1,82 +1,119 @@
 from fasthtml.common import *
 import pandas as pd
+import numpy as np
 import os
+import io
+import re
+import json
+import csv
+import shutil
+import time
+import hashlib
+import unicodedata
+from bisect import bisect_left
+import asyncio
+from html import escape
+from email.utils import formatdate, parsedate_to_datetime
+import threading
+import queue
+import atexit
+import apsw
+import gzip
+from collections import OrderedDict, Counter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from dataclasses import dataclass
 from fastlite import Database
 
-# Initialize the FastHTML app with Tailwind CSS
-app, rt = fast_app(
-    hdrs=(
-        Script(src="https://cdn.tailwindcss.com"),
-        Script("""
-            tailwind.config = {
-                theme: {
-                    extend: {
-                        colors: {
-                            primary: '#2563eb',
-                            secondary: '#7c3aed',
-                        }
-                    }
-                }
-            }
-        """),
-        Style("""
-            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap');
-            
-            * {
-                font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            }
-            
-            body {
-                background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-            }
-            
-            .gradient-text {
-                background: linear-gradient(135deg, #2563eb, #7c3aed);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            }
-            
-            .gradient-bg {
-                background: linear-gradient(135deg, #2563eb, #7c3aed);
-            }
-            
-            .position-badge-1 {
-                background: linear-gradient(135deg, #fbbf24, #f59e0b);
-            }
-            
-            .position-badge-2 {
-                background: linear-gradient(135deg, #e2e8f0, #94a3b8);
-            }
-            
-            .position-badge-3 {
-                background: linear-gradient(135deg, #f97316, #ea580c);
-            }
-            
-            @keyframes fadeIn {
-                from { opacity: 0; transform: translateY(10px); }
-                to { opacity: 1; transform: translateY(0); }
-            }
-            
-            .animate-fade-in {
-                animation: fadeIn 0.5s ease-out;
-            }
-        """)
+try:
+    import brotli
+except ImportError:  # brotli is optional; pages are still served gzipped
+    brotli = None
+
+# Stylesheet prebuilt from static/app.src.css (Tailwind classes purged to
+# those main.py uses) and served under a content fingerprint so browsers
+# can cache it forever
+STATIC_PATH = Path(__file__).parent / "static"
+STYLESHEET_PATH = STATIC_PATH / "app.css"
+STYLESHEET = STYLESHEET_PATH.read_bytes() if STYLESHEET_PATH.exists() else b""
+STYLESHEET_VERSION = hashlib.sha1(STYLESHEET).hexdigest()[:10]
+STYLESHEET_URL = f"/static/app.{STYLESHEET_VERSION}.css"
+FONTS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap"
+
+# htmx and its server-sent events extension, for pages with live updates
+HTMX_URL = "https://cdn.jsdelivr.net/npm/htmx.org@2.0.7/dist/htmx.min.js"
+HTMX_SSE_URL = "https://cdn.jsdelivr.net/npm/htmx-ext-sse@2.2.2/sse.js"
+
+def page_head(title, *extra):
+    """Shared <head> for every page: fonts plus the one fingerprinted stylesheet"""
+    return Head(
+        Title(title),
+        Meta(charset="utf-8"),
+        Meta(name="viewport", content="width=device-width, initial-scale=1"),
+        Link(rel="preconnect", href="https://fonts.googleapis.com"),
+        Link(rel="preconnect", href="https://fonts.gstatic.com", crossorigin=""),
+        Link(rel="stylesheet", href=FONTS_URL),
+        Link(rel="stylesheet", href=STYLESHEET_URL),
+        *extra,
     )
+
+# Initialize the FastHTML app with the prebuilt Tailwind stylesheet
+app, rt = fast_app(
+    hdrs=(Link(rel="stylesheet", href=STYLESHEET_URL),),
+    on_startup=[lambda: visit_retention.start()],
+    # Flush buffered visits before the worker exits
+    on_shutdown=[lambda: visit_writer.close(), lambda: visit_retention.stop()],
 )
 
-# Path to the results folder
-RESULTS_PATH = Path(__file__).parent / "data" / "bgx-result-2025-full"
+# Folder holding one results directory per season, e.g. bgx-result-2025-full/
+RESULTS_ROOT = Path(os.getenv("RESULTS_ROOT", Path(__file__).parent / "data"))
 
-# Initialize database for visit tracking
-DB_PATH = Path(__file__).parent / "data" / "visits.db"
-db = Database(DB_PATH)
+# Database for visit tracking
+DB_PATH = Path(os.getenv("VISITS_DB_PATH", Path(__file__).parent / "data" / "visits.db"))
 
-# Define visits dataclass for the table
-from dataclasses import dataclass
+# SQLite connection settings applied to every connection we open
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", SQLITE_BUSY_TIMEOUT_MS),
+    ("cache_size", -SQLITE_CACHE_SIZE_KB),
+    ("mmap_size", SQLITE_MMAP_SIZE),
+)
+
+def open_db(db_path=DB_PATH):
+    """Open a fastlite Database with SQLITE_PRAGMAS applied.
+
+    Everything goes through fastlite's apsw connections: mixing in the
+    stdlib sqlite3 module would load a second SQLite library whose POSIX
+    locks don't see apsw's, which can corrupt the file under concurrency.
+    """
+    handle = Database(db_path)
+    for name, value in SQLITE_PRAGMAS:
+        handle.conn.execute(f"PRAGMA {name} = {value}").fetchall()
+    return handle
+
+def connect_sqlite(db_path=DB_PATH):
+    """Open a tuned connection owned by a background job"""
+    return open_db(db_path).conn
+
+_db_local = threading.local()
 
+def get_db():
+    """fastlite Database for the current worker process and thread.
+
+    Connections are opened lazily, one per thread, and reopened after a
+    fork so gunicorn workers never share a handle inherited from the master.
+    """
+    handle = getattr(_db_local, "db", None)
+    if handle is None or _db_local.pid != os.getpid():
+        handle = open_db(DB_PATH)
+        _db_local.db, _db_local.pid = handle, os.getpid()
+    return handle
+
+# Define visits dataclass for the table
 @dataclass
 class Visit:
     id: int = None
@@ -85,21 +122,141 @@ class Visit:
     category: str = None
     device_type: str = None
 
-# Create visits table if it doesn't exist
-visits_table = db.create(Visit, pk="id", if_not_exists=True)
+# Hourly visit counts, kept up to date by the visit writer so /stats reads
+# O(buckets) rows instead of O(visits)
+ROLLUP_UPSERT_SQL = """
+    INSERT INTO visit_rollup (bucket, page, category, device_type, count)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (bucket, page, category, device_type)
+    DO UPDATE SET count = count + excluded.count
+"""
+
+def rollup_bucket(timestamp: str) -> str:
+    """Hour bucket for an ISO timestamp, e.g. '2025-05-01T10:00'"""
+    return f"{timestamp[:13]}:00"
 
-# Migrate existing table to add device_type column if it doesn't exist
-# First check if the table exists (fastlite creates table name from class name)
-table_exists = db.conn.execute(
-    "SELECT name FROM sqlite_master WHERE type='table' AND name='visit'"
-).fetchone()
+def rollup_rows(visits):
+    """Aggregate (timestamp, page, category, device_type) rows into rollup upserts"""
+    counts = Counter(
+        (rollup_bucket(ts), page or "", category or "", device_type or "unknown")
+        for ts, page, category, device_type in visits
+    )
+    return [(*key, n) for key, n in counts.items()]
+
+def backfill_visit_rollups(conn=None):
+    """Rebuild visit_rollup from the raw visit table; returns the number of buckets.
 
-if table_exists:
-    # Check if device_type column exists
-    columns = [row[1] for row in db.conn.execute("PRAGMA table_info(visit)")]
+    Buckets older than the oldest raw visit are kept, since retention has
+    already deleted the rows they summarize.
+    """
+    conn = conn or get_db().conn
+    oldest = conn.execute("SELECT MIN(timestamp) FROM visit").fetchone()[0]
+    if oldest is not None:
+        with conn:
+            conn.execute("DELETE FROM visit_rollup WHERE bucket >= ?", (rollup_bucket(oldest),))
+            conn.execute("""
+                INSERT INTO visit_rollup (bucket, page, category, device_type, count)
+                SELECT substr(timestamp, 1, 13) || ':00', COALESCE(page, ''),
+                       COALESCE(category, ''), COALESCE(device_type, 'unknown'), COUNT(*)
+                FROM visit
+                GROUP BY 1, 2, 3, 4
+            """)
+    return conn.execute("SELECT COUNT(*) FROM visit_rollup").fetchone()[0]
+
+# Schema migrations, applied in order; PRAGMA user_version records how many
+# have run. Each step must also be safe on databases that predate versioning.
+def _migrate_visit_table(handle):
+    """Create the visit table and add device_type to tables from before it existed"""
+    # fastlite creates table name from class name
+    handle.create(Visit, pk="id", if_not_exists=True)
+    columns = [row[1] for row in handle.conn.execute("PRAGMA table_info(visit)")]
     if 'device_type' not in columns:
         print("Adding device_type column to visit table...")
-        db.conn.execute("ALTER TABLE visit ADD COLUMN device_type TEXT DEFAULT 'unknown'")
+        handle.conn.execute("ALTER TABLE visit ADD COLUMN device_type TEXT DEFAULT 'unknown'")
+
+def _migrate_visit_indexes(handle):
+    """Indexes backing the /stats aggregations"""
+    handle.conn.execute("CREATE INDEX IF NOT EXISTS idx_visit_timestamp ON visit (timestamp)")
+    handle.conn.execute("CREATE INDEX IF NOT EXISTS idx_visit_page_category ON visit (page, category)")
+    handle.conn.execute("CREATE INDEX IF NOT EXISTS idx_visit_category ON visit (category)")
+    handle.conn.execute("CREATE INDEX IF NOT EXISTS idx_visit_device_type ON visit (device_type)")
+
+def _migrate_visit_rollup(handle):
+    """Hourly rollup table, backfilled from the visits recorded so far"""
+    rollup_exists = handle.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='visit_rollup'"
+    ).fetchone()
+    handle.conn.execute("""
+        CREATE TABLE IF NOT EXISTS visit_rollup (
+            bucket TEXT NOT NULL,
+            page TEXT NOT NULL,
+            category TEXT NOT NULL,
+            device_type TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket, page, category, device_type)
+        )
+    """)
+    if not rollup_exists:
+        print("Building visit rollups from existing visits...")
+        backfill_visit_rollups(handle.conn)
+
+def _migrate_job_run(handle):
+    """Last run of each background job, shared by every worker process"""
+    handle.conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_run (
+            name TEXT PRIMARY KEY,
+            last_run TEXT NOT NULL
+        )
+    """)
+
+MIGRATIONS = [
+    _migrate_visit_table,
+    _migrate_visit_indexes,
+    _migrate_visit_rollup,
+    _migrate_job_run,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(db_path=DB_PATH):
+    """Apply pending migrations; returns the list of versions applied.
+
+    Runs under BEGIN IMMEDIATE so concurrent callers (e.g. several workers
+    booting against an old database) serialize and only one does the work.
+    Run it once before starting the workers with `python main.py migrate`.
+    """
+    handle = open_db(db_path)
+    conn = handle.conn
+    try:
+        # Let the retention job release free pages in small steps. Switching
+        # needs a VACUUM, which is instant on a new database; run `python
+        # main.py compact --full-vacuum` once to convert an existing one.
+        if not conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0]:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = schema_version(conn)
+            applied = []
+            for version in range(current + 1, SCHEMA_VERSION + 1):
+                MIGRATIONS[version - 1](handle)
+                conn.execute(f"PRAGMA user_version = {version}")
+                applied.append(version)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return applied
+    finally:
+        conn.close()
+
+# Worker startup only checks the schema version; the migrations themselves
+# normally ran once already, before the workers were started (the CLI
+# below migrates explicitly)
+if __name__ != "__main__" and schema_version(get_db().conn) < SCHEMA_VERSION:
+    migrate()
 
 def detect_device_type(user_agent: str) -> str:
     """Detect if the request is from mobile or desktop based on User-Agent"""
@@ -115,15 +272,293 @@ def detect_device_type(user_agent: str) -> str:
     
     return "desktop"
 
+# Visit write-behind settings: flush every N visits or every T milliseconds,
+# buffering at most VISIT_QUEUE_SIZE pending visits
+VISIT_BATCH_SIZE = int(os.getenv("VISIT_BATCH_SIZE", "100"))
+VISIT_FLUSH_INTERVAL_MS = int(os.getenv("VISIT_FLUSH_INTERVAL_MS", "500"))
+VISIT_QUEUE_SIZE = int(os.getenv("VISIT_QUEUE_SIZE", "10000"))
+
+class VisitWriter:
+    """Write-behind queue for visit events.
+
+    Requests only enqueue a row; a background thread owns its own SQLite
+    connection and inserts the rows in batched executemany transactions,
+    updating the hourly visit_rollup counters in the same transaction.
+    When the buffer is full new visits are dropped and counted rather than
+    blocking the request.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path, batch_size=VISIT_BATCH_SIZE,
+                 flush_interval_ms=VISIT_FLUSH_INTERVAL_MS, max_pending=VISIT_QUEUE_SIZE):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+
+    def submit(self, row):
+        """Queue a (timestamp, page, category, device_type) row without blocking"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+        else:
+            with self._lock:
+                self.enqueued += 1
+
+    def _ensure_started(self):
+        # Threads don't survive a fork, so each worker process starts its own
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name="visit-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        conn = connect_sqlite(self.db_path)
+        batch = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    row = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    row = None
+                if row is self._STOP:
+                    break
+                if row is not None:
+                    batch.append(row)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                if batch and (len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                    self._flush(conn, batch)
+                    batch, deadline = [], None
+            # Drain whatever is still buffered on shutdown
+            while True:
+                try:
+                    row = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if row is not self._STOP:
+                    batch.append(row)
+            if batch:
+                self._flush(conn, batch)
+        finally:
+            conn.close()
+
+    def _flush(self, conn, batch):
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO visit (timestamp, page, category, device_type) VALUES (?, ?, ?, ?)",
+                    batch,
+                )
+                conn.executemany(ROLLUP_UPSERT_SQL, rollup_rows(batch))
+            with self._lock:
+                self.written += len(batch)
+                self.batches += 1
+        except apsw.Error as e:
+            with self._lock:
+                self.errors += 1
+                self.dropped += len(batch)
+            print(f"Failed to write {len(batch)} visits: {e}")
+
+    def close(self, timeout=10):
+        """Flush pending visits and stop the writer thread"""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid() or not thread.is_alive():
+            return
+        self._queue.put(self._STOP)
+        thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "batches": self.batches,
+                "errors": self.errors,
+                "pending": self._queue.qsize(),
+            }
+
+visit_writer = VisitWriter(DB_PATH)
+atexit.register(visit_writer.close)
+
+# Raw visit retention: keep VISIT_RETENTION_DAYS of raw rows (0 keeps
+# everything), checking every VISIT_RETENTION_INTERVAL seconds
+VISIT_RETENTION_DAYS = int(os.getenv("VISIT_RETENTION_DAYS", "90"))
+VISIT_RETENTION_INTERVAL = int(os.getenv("VISIT_RETENTION_INTERVAL", "3600"))
+VISIT_RETENTION_BATCH = int(os.getenv("VISIT_RETENTION_BATCH", "1000"))
+VISIT_VACUUM_PAGES = int(os.getenv("VISIT_VACUUM_PAGES", "256"))
+
+class VisitRetention:
+    """Background job enforcing the raw-visit retention policy.
+
+    Raw visit rows older than the retention window are deleted in small
+    batches. Their counts already live in visit_rollup, which the visit
+    writer updates as the rows are inserted. The cutoff is rounded down to
+    the hour so every rollup bucket is either fully raw-backed or fully
+    compacted. Each step is followed by a PASSIVE WAL checkpoint and, when
+    the database uses incremental auto_vacuum, a few pages of
+    incremental_vacuum, so the file stays bounded without one long VACUUM
+    stalling requests.
+
+    Every worker process starts the job, but a run first claims the
+    job_run row under BEGIN IMMEDIATE, so only one worker per interval
+    does the work and the rest skip.
+    """
+
+    def __init__(self, db_path, retention_days=VISIT_RETENTION_DAYS, interval=VISIT_RETENTION_INTERVAL,
+                 batch_size=VISIT_RETENTION_BATCH, vacuum_pages=VISIT_VACUUM_PAGES, pause=0.05):
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.interval = interval
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+        self.pause = pause
+        self._stop = threading.Event()
+        self._thread = None
+        self.runs = 0
+        self.skipped = 0
+        self.deleted = 0
+        self.vacuumed_pages = 0
+        self.last_run = None
+
+    def start(self):
+        if self.retention_days <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="visit-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except apsw.Error as e:
+                print(f"Visit retention failed: {e}")
+            self._stop.wait(self.interval)
+
+    def cutoff(self, now=None):
+        """Oldest raw timestamp to keep, rounded down to the hour"""
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=self.retention_days)
+        return cutoff.replace(minute=0, second=0, microsecond=0).isoformat()
+
+    def claim(self, conn, force=False):
+        """Record a run in job_run unless another worker ran within the interval"""
+        started = datetime.now()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT last_run FROM job_run WHERE name = 'visit_retention'").fetchone()
+            if not force and row and datetime.fromisoformat(row[0]) > started - timedelta(seconds=self.interval):
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT INTO job_run (name, last_run) VALUES ('visit_retention', ?) "
+                "ON CONFLICT (name) DO UPDATE SET last_run = excluded.last_run",
+                (started.isoformat(),),
+            )
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def run_once(self, now=None, force=False):
+        """Delete expired raw visits and compact the file; returns rows deleted.
+
+        Returns None without touching the file when another worker already
+        ran within the interval, unless force is set.
+        """
+        conn = connect_sqlite(self.db_path)
+        try:
+            if not self.claim(conn, force):
+                self.skipped += 1
+                return None
+            conn.execute("PRAGMA journal_size_limit = 67108864")
+            incremental = conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+            cutoff = self.cutoff(now)
+            deleted = 0
+            while not self._stop.is_set():
+                with conn:
+                    conn.execute(
+                        "DELETE FROM visit WHERE id IN "
+                        "(SELECT id FROM visit WHERE timestamp < ? ORDER BY timestamp LIMIT ?)",
+                        (cutoff, self.batch_size),
+                    )
+                    n = conn.changes()
+                deleted += n
+                self._compact_step(conn, incremental)
+                if n < self.batch_size:
+                    break
+                time.sleep(self.pause)
+            # Release any remaining free pages a step at a time
+            while incremental and not self._stop.is_set() and conn.execute("PRAGMA freelist_count").fetchone()[0]:
+                self._compact_step(conn, incremental)
+                time.sleep(self.pause)
+            self.runs += 1
+            self.deleted += deleted
+            self.last_run = datetime.now().isoformat()
+            return deleted
+        finally:
+            conn.close()
+
+    def _compact_step(self, conn, incremental):
+        if incremental:
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            conn.execute(f"PRAGMA incremental_vacuum({self.vacuum_pages})").fetchall()
+            self.vacuumed_pages += before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+
+    def stats(self):
+        return {
+            "retention_days": self.retention_days,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "deleted": self.deleted,
+            "vacuumed_pages": self.vacuumed_pages,
+            "last_run": self.last_run,
+        }
+
+visit_retention = VisitRetention(DB_PATH)
+
+def full_vacuum(db_path=DB_PATH):
+    """One-off VACUUM that switches an existing database to incremental auto_vacuum"""
+    conn = connect_sqlite(db_path)
+    try:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+    finally:
+        conn.close()
+
 def track_visit(page: str, category: str = "", user_agent: str = ""):
-    """Track a page visit with device type"""
+    """Track a page visit with device type (written asynchronously in batches)"""
     device_type = detect_device_type(user_agent)
-    visits_table.insert(
-        timestamp=datetime.now().isoformat(),
-        page=page,
-        category=category,
-        device_type=device_type
-    )
+    visit_writer.submit((datetime.now().isoformat(), page, category, device_type))
 
 # Define categories with display names
 CATEGORIES = {
@@ -137,14 +572,737 @@ CATEGORIES = {
     "seniors_50": "Senior 50+"
 }
 
-def load_category_data(category):
-    """Load CSV data for a specific category"""
-    csv_path = RESULTS_PATH / f"{category}.csv"
-    if not csv_path.exists():
-        return None
+# How often (seconds) the store re-checks a results file for changes
+STANDINGS_CHECK_INTERVAL = float(os.getenv("STANDINGS_CHECK_INTERVAL", "1.0"))
+
+# Where the columnar snapshots of the results CSVs are written
+SNAPSHOT_PATH = Path(os.getenv("SNAPSHOT_PATH", RESULTS_ROOT / "snapshots"))
+
+class ColumnarSnapshots:
+    """Binary columnar snapshots of the category CSVs, one directory per data version.
+
+    Each column is stored as its own .npy file and loaded with mmap_mode="r",
+    so numeric columns are never copied into the process: every worker maps
+    the same file and shares its pages through the OS page cache. Text
+    columns are stored as fixed-width unicode with a null mask and converted
+    back to the frame's string dtype on load.
+
+    Snapshots are named after the CSV content hash, so the CSV stays the
+    source of truth: a changed CSV has a new hash and its snapshot is built
+    on first use, after which older snapshots for that category are pruned.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        self.path = Path(path)
+        self.loads = 0
+        self.builds = 0
+        self.errors = 0
+
+    def snapshot_dir(self, category, version):
+        return self.path / f"{category}-{version}"
+
+    def load_or_build(self, category, version, raw):
+        """Return the frame for this CSV version, building its snapshot if needed"""
+        try:
+            df = self.load(category, version)
+            if df is not None:
+                self.loads += 1
+                return df
+            df = pd.read_csv(io.BytesIO(raw))
+            self.write(category, version, df)
+            self.builds += 1
+            # Reload so this worker also gets the memory-mapped columns
+            return self.load(category, version)
+        except (OSError, ValueError):
+            # A read-only or broken snapshot directory must not take the site down
+            self.errors += 1
+            return pd.read_csv(io.BytesIO(raw))
+
+    def load(self, category, version):
+        """Memory-map a snapshot into a DataFrame, or None if it hasn't been built"""
+        snapshot = self.snapshot_dir(category, version)
+        try:
+            columns = json.loads((snapshot / "columns.json").read_text())
+        except FileNotFoundError:
+            return None
+        data = {}
+        for i, name in enumerate(columns):
+            values = np.load(snapshot / f"{i}.npy", mmap_mode="r")
+            if values.dtype.kind == "U":
+                values = values.astype(object)
+                values[np.load(snapshot / f"{i}.na.npy")] = np.nan
+                values = pd.Series(values, dtype="str")
+            data[name] = values
+        return pd.DataFrame(data, copy=False)
+
+    def write(self, category, version, df):
+        """Write a frame's snapshot atomically next to any existing ones"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        target = self.snapshot_dir(category, version)
+        staging = self.path / f".{target.name}.{os.getpid()}.tmp"
+        staging.mkdir(exist_ok=True)
+        for i, name in enumerate(df.columns):
+            column = df[name]
+            if column.dtype.kind in "biuf":
+                np.save(staging / f"{i}.npy", column.to_numpy())
+            else:
+                na = column.isna().to_numpy()
+                np.save(staging / f"{i}.npy", column.fillna("").to_numpy(dtype=str))
+                np.save(staging / f"{i}.na.npy", na)
+        (staging / "columns.json").write_text(json.dumps(list(df.columns), ensure_ascii=False))
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another worker published the same version first
+            shutil.rmtree(staging, ignore_errors=True)
+        self.prune(category, keep=version)
+
+    def prune(self, category, keep):
+        """Remove snapshots of older versions of a category"""
+        for old in self.path.glob(f"{category}-*"):
+            if old.name != f"{category}-{keep}":
+                shutil.rmtree(old, ignore_errors=True)
+
+    def stats(self):
+        return {"loads": self.loads, "builds": self.builds, "errors": self.errors}
+
+@dataclass
+class StandingsEntry:
+    df: object = None
+    version: str = None
+    mtime_ns: int = None
+    size: int = None
+    checked_at: float = 0.0
+    progression: object = None
+
+class StandingsStore:
+    """In-memory store of the parsed category CSVs.
+
+    Every category is loaded once at startup (from its columnar snapshot when
+    one is given), together with its round-by-round progression, and each
+    request gets the cached frame. A category is re-read only when its file's mtime/size changes and
+    re-parsed only when the content hash changes, so results can be updated
+    on disk without a restart. Frames are shared between requests and must be
+    treated as read-only.
+    """
+
+    def __init__(self, results_path, categories, check_interval=STANDINGS_CHECK_INTERVAL, snapshots=None):
+        self.results_path = Path(results_path)
+        self.categories = list(categories)
+        self.check_interval = check_interval
+        self.snapshots = snapshots
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def csv_path(self, category):
+        return self.results_path / f"{category}.csv"
+
+    def load_all(self):
+        """Parse every known category up front"""
+        for category in self.categories:
+            self.get(category)
+
+    def get(self, category):
+        """Return the parsed frame for a category, or None if it has no data"""
+        return self.get_with_version(category)[0]
+
+    def get_with_version(self, category):
+        """Return (frame, version) for a category, read together under the lock.
+
+        Pages cached by version must take both from here: a reload between a
+        get() and a version() call would file the old frame under the new
+        version. (None, None) if the category has no data.
+        """
+        entry = self._checked(category)
+        return entry[0], entry[2]
+
+    def progression_with_version(self, category):
+        """Return (frame, progression, version) for a category as one consistent set"""
+        return self._checked(category)
+
+    def _checked(self, category):
+        """(frame, progression, version) after the periodic file check, taken under the lock"""
+        if category not in self.categories:
+            return None, None, None
+        with self._lock:
+            entry = self._entries.get(category)
+            if entry is None:
+                self.misses += 1
+                entry = self._entries[category] = StandingsEntry()
+                self._refresh(category, entry, force=True)
+            elif time.monotonic() - entry.checked_at >= self.check_interval:
+                if self._refresh(category, entry):
+                    self.reloads += 1
+                else:
+                    self.hits += 1
+            else:
+                self.hits += 1
+            return entry.df, entry.progression, entry.version
+
+    def version(self, category):
+        """Content hash of the category's data as of the last get() (None if missing)"""
+        entry = self._entries.get(category)
+        return entry.version if entry else None
+
+    def last_modified(self, category):
+        """Modification time (epoch seconds) of the category's file as of the last get()"""
+        entry = self._entries.get(category)
+        return entry.mtime_ns / 1e9 if entry and entry.mtime_ns else None
+
+    def newest_modified(self):
+        """Latest modification time (epoch seconds) of any loaded category's file"""
+        return max((entry.mtime_ns / 1e9 for entry in self._entries.values() if entry.mtime_ns), default=None)
+
+    def _refresh(self, category, entry, force=False):
+        """Re-read the file if it changed; returns True if the frame was replaced"""
+        entry.checked_at = time.monotonic()
+        try:
+            st = self.csv_path(category).stat()
+        except FileNotFoundError:
+            changed = entry.version is not None
+            entry.df = entry.version = entry.mtime_ns = entry.size = entry.progression = None
+            return changed
+        if not force and st.st_mtime_ns == entry.mtime_ns and st.st_size == entry.size:
+            return False
+        raw = self.csv_path(category).read_bytes()
+        version = hashlib.sha1(raw).hexdigest()[:16]
+        entry.mtime_ns, entry.size = st.st_mtime_ns, st.st_size
+        if not force and version == entry.version:
+            return False
+        if self.snapshots is not None:
+            entry.df = self.snapshots.load_or_build(category, version, raw)
+        else:
+            entry.df = pd.read_csv(io.BytesIO(raw))
+        # Every round's standings are built along with the frame
+        entry.progression = round_progression(entry.df)
+        entry.version = version
+        return True
+
+    def progression(self, category):
+        """Round-by-round progression of a category (None if it has no data)"""
+        return self._checked(category)[1]
+
+    def update(self, category, frame):
+        """Publish a new frame for a category; returns its data version.
+
+        The CSV is rewritten (so other workers pick the change up on their
+        next check) and reloaded here straight away.
+        """
+        write_standings(self.results_path, {category: frame})
+        with self._lock:
+            entry = self._entries.setdefault(category, StandingsEntry())
+            self._refresh(category, entry, force=True)
+            self.reloads += 1
+            return entry.version
+
+    def stats(self):
+        """Hit/miss/reload counters and the loaded data versions"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "versions": {k: e.version for k, e in self._entries.items()},
+                "snapshots": self.snapshots.stats() if self.snapshots is not None else None,
+            }
+
+# Season results directories are named bgx-result-<year>[-suffix]
+SEASON_DIR_PATTERN = re.compile(r"bgx-result-(\d{4})(?:-.+)?")
+# Maximum number of seasons whose standings are kept in memory
+SEASON_CACHE_SIZE = int(os.getenv("SEASON_CACHE_SIZE", "3"))
+
+class SeasonCatalog:
+    """Discovers the season results directories and loads them on demand.
+
+    A season's StandingsStore is created on its first request and kept in an
+    LRU of at most maxsize seasons, so archived seasons nobody is viewing
+    don't stay resident. The results root is rescanned every check_interval
+    seconds, so a new season directory is picked up without a restart.
+    """
+
+    def __init__(self, root, categories, maxsize=SEASON_CACHE_SIZE,
+                 snapshot_path=SNAPSHOT_PATH, check_interval=STANDINGS_CHECK_INTERVAL):
+        self.root = Path(root)
+        self.categories = categories
+        self.maxsize = maxsize
+        self.snapshot_path = Path(snapshot_path)
+        self.check_interval = check_interval
+        self._dirs = {}
+        self._scanned_at = None
+        self._stores = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def seasons(self):
+        """Known seasons, newest first, mapped to their results directory"""
+        with self._lock:
+            return dict(self._scan())
+
+    def default_season(self):
+        """The newest season, or None if there are no results at all"""
+        return next(iter(self.seasons()), None)
+
+    def version(self):
+        """Hash of the season list; pages linking to other seasons depend on it"""
+        return hashlib.sha1(",".join(self.seasons()).encode()).hexdigest()[:8]
+
+    def get(self, season):
+        """Return the standings store for a season, or None if it doesn't exist"""
+        with self._lock:
+            store = self._stores.get(season)
+            if store is not None:
+                self._stores.move_to_end(season)
+                return store
+            path = self._scan().get(season)
+            if path is None:
+                return None
+            store = self._stores[season] = StandingsStore(
+                path, self.categories, self.check_interval,
+                snapshots=ColumnarSnapshots(self.snapshot_path / season),
+            )
+            self.loads += 1
+            while len(self._stores) > self.maxsize:
+                self._stores.popitem(last=False)
+                self.evictions += 1
+            return store
+
+    def _scan(self):
+        if self._scanned_at is None or time.monotonic() - self._scanned_at >= self.check_interval:
+            found = {}
+            if self.root.is_dir():
+                for path in sorted(self.root.iterdir()):
+                    match = SEASON_DIR_PATTERN.fullmatch(path.name)
+                    if match and path.is_dir():
+                        found[match.group(1)] = path
+            self._dirs = dict(sorted(found.items(), reverse=True))
+            self._scanned_at = time.monotonic()
+        return self._dirs
+
+    def stats(self):
+        """Season load/eviction counters and the stats of each resident season"""
+        with self._lock:
+            return {
+                "seasons": list(self._dirs),
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "resident": {season: store.stats() for season, store in self._stores.items()},
+            }
+
+season_catalog = SeasonCatalog(RESULTS_ROOT, CATEGORIES)
+
+# Season shown when none is requested; unset means the newest one
+DEFAULT_SEASON = os.getenv("DEFAULT_SEASON")
+
+def resolve_season(season=None):
+    """The requested season, or the default one"""
+    return season or DEFAULT_SEASON or season_catalog.default_season()
+
+def load_category_data(category, season=None):
+    """Load CSV data for a category of a season (default: the current one) from its standings store"""
+    store = season_catalog.get(resolve_season(season))
+    return store.get(category) if store is not None else None
+
+def fold_name(text):
+    """Normalize a name or query for matching: NFKC, case-folded, single-spaced"""
+    return " ".join(unicodedata.normalize("NFKC", str(text)).casefold().split())
+
+def _points(value):
+    return None if pd.isna(value) else float(value)
+
+class RiderIndex:
+    """Search index over every rider of a season, across all categories.
+
+    Riders are flattened into plain records once, when the index is built.
+    Race numbers go into a hash map and folded names into a sorted prefix
+    array ("first", "last", "first last" and "last first" per rider), so a
+    lookup is a dict hit or a bisect and never touches the frames.
+    """
+
+    def __init__(self, frames, version=None):
+        self.version = version
+        self.records = []
+        self._rows = []
+        self._by_number = {}
+        keys = []
+        for category, df in frames.items():
+            if df is None or df.empty:
+                continue
+            race_cols = get_race_columns(df)
+            columns = [df[c].tolist() for c in ["FinalPosition", "RaceNumber", "FirstName", "LastName",
+                                                 "TotalPoints", "RacesParticipated", "BestPosition"]]
+            scores = [df[c].tolist() for c in race_cols]
+            for i, (position, number, first, last, total, races, best) in enumerate(zip(*columns)):
+                rid = len(self.records)
+                self.records.append({
+                    "category": category,
+                    "category_name": CATEGORIES.get(category, category),
+                    "position": int(position),
+                    "number": int(number),
+                    "first_name": str(first),
+                    "last_name": str(last),
+                    "total_points": _points(total),
+                    "races": int(races),
+                    "best_position": int(best),
+                    "scores": {c.removeprefix("Race_"): _points(col[i]) for c, col in zip(race_cols, scores)},
+                })
+                self._rows.append(i)
+                self._by_number.setdefault(int(number), []).append(rid)
+                first, last = fold_name(first), fold_name(last)
+                keys.extend(((first, rid), (last, rid), (f"{first} {last}", rid), (f"{last} {first}", rid)))
+        keys.sort()
+        self._keys = [k for k, _ in keys]
+        self._ids = [rid for _, rid in keys]
+
+    def rider(self, number):
+        """(record, row in its category's frame) for each category the race number rides in"""
+        return [(self.records[rid], self._rows[rid]) for rid in self._by_number.get(number, ())]
+
+    def search(self, query, limit=20):
+        """Riders with this race number, or whose names start with the query (alphabetically)"""
+        query = fold_name(query)
+        if not query:
+            return []
+        if query.isdigit():
+            return [self.records[rid] for rid in self._by_number.get(int(query), ())][:limit]
+        found = {}
+        i = bisect_left(self._keys, query)
+        while i < len(self._keys) and len(found) < limit and self._keys[i].startswith(query):
+            found.setdefault(self._ids[i], None)
+            i += 1
+        return [self.records[rid] for rid in found]
+
+class RiderSearch:
+    """Rider indexes of the resident seasons, rebuilt when a category's data changes"""
+
+    def __init__(self, maxsize=SEASON_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.queries = 0
+
+    def index(self, season):
+        """The season's index for its current data versions (None for an unknown season)"""
+        store = season_catalog.get(season)
+        if store is None:
+            return None
+        current = {category: store.get_with_version(category) for category in CATEGORIES}
+        frames = {category: df for category, (df, _) in current.items()}
+        versions = tuple(version for _, version in current.values())
+        with self._lock:
+            cached = self._indexes.get(season)
+            if cached is not None and cached[0] == versions:
+                self._indexes.move_to_end(season)
+                return cached[1]
+        index = RiderIndex(frames, hashlib.sha1(repr(versions).encode()).hexdigest()[:16])
+        with self._lock:
+            self._indexes[season] = (versions, index)
+            self._indexes.move_to_end(season)
+            self.builds += 1
+            while len(self._indexes) > self.maxsize:
+                self._indexes.popitem(last=False)
+        return index
+
+    def search(self, season, query, limit=20):
+        index = self.index(season)
+        self.queries += 1
+        return index.search(query, limit) if index is not None else None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "builds": self.builds,
+                "queries": self.queries,
+                "riders": {season: len(index.records) for season, (_, index) in self._indexes.items()},
+            }
+
+rider_search = RiderSearch()
+
+# Championship scoring: points for finishing positions 1..20 (anything
+# lower scores 0), with each rider's worst DROP_WORST results dropped once
+# they have started more than (rounds - DROP_WORST) rounds
+POINTS_TABLE = (25, 22, 20, 18, 16, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+DROP_WORST = int(os.getenv("DROP_WORST", "1"))
+
+# Leading columns of a category's standings, followed by one Race_<race>
+# column of points per race
+STANDINGS_COLUMNS = ["FinalPosition", "RaceNumber", "FirstName", "LastName", "TotalPoints",
+                     "RacesParticipated", "BestPosition", "WorstResultDropped", "WorstRace"]
+
+# Per-race finishing results live in <season dir>/races/<race>.csv
+RACE_RESULT_COLUMNS = ["Category", "Position", "RaceNumber", "FirstName", "LastName"]
+
+def load_race_results(season_dir):
+    """Concatenate a season's per-race result files into one long frame (None if there are none)"""
+    frames = []
+    for path in sorted((Path(season_dir) / "races").glob("*.csv")):
+        frame = pd.read_csv(path)
+        frame["Race"] = path.stem
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+def race_points(results, points_table=POINTS_TABLE):
+    """Finishing positions (NaN if unclassified) and points for each row of race results"""
+    positions = pd.to_numeric(results["Position"], errors="coerce").to_numpy(dtype=float)
+    table = np.asarray(points_table, dtype=float)
+    scoring = (positions >= 1) & (positions <= len(table))
+    points = np.where(scoring, table[np.clip(np.nan_to_num(positions), 1, len(table)).astype(int) - 1], 0.0)
+    if "Points" in results:
+        override = pd.to_numeric(results["Points"], errors="coerce").to_numpy(dtype=float)
+        points = np.where(np.isnan(override), points, override)
+    return positions, points
+
+def compute_standings(results, points_table=POINTS_TABLE, drop_worst=DROP_WORST, rounds=None):
+    """Championship standings for every category from per-race finishing results.
+
+    results has one row per rider start with the RACE_RESULT_COLUMNS plus
+    Race; Position is NaN for starters who weren't classified, and an
+    optional Points column overrides the table for rounds scored
+    differently. rounds defaults to the number of races in results.
+
+    All categories are scored and ranked in a single vectorized pass over a
+    riders x races points matrix. Ties on total points are broken by
+    count-back (most wins, then most 2nds, ...), then best position, then
+    race number. Returns {category: frame} in the results CSV layout.
+    """
+    positions, points = race_points(results, points_table)
+    table = np.asarray(points_table, dtype=float)
+    scoring = (positions >= 1) & (positions <= len(table))
+    
+    # One row per (category, rider), one column per race in name order
+    category_codes, category_names = pd.factorize(results["Category"])
+    race_numbers = results["RaceNumber"].to_numpy(dtype=np.int64)
+    riders, rider_keys = pd.factorize((category_codes.astype(np.int64) << 32) | race_numbers)
+    race_codes, race_names = pd.factorize(results["Race"], sort=True)
+    n_riders, n_races = len(rider_keys), len(race_names)
+    rounds = n_races if rounds is None else rounds
+    
+    matrix = np.full((n_riders, n_races), np.nan)
+    matrix[riders, race_codes] = points
+    finishes = np.full((n_riders, n_races), np.inf)
+    finishes[riders, race_codes] = np.where(positions >= 1, positions, np.inf)
+    started = ~np.isnan(matrix)
+    participated = started.sum(axis=1)
+    
+    # Drop the lowest results; the stable sort makes the first of equal
+    # results (in race name order) the one reported as WorstRace
+    n_drop = np.clip(participated - (rounds - drop_worst), 0, drop_worst)
+    order = np.argsort(np.where(started, matrix, np.inf), axis=1, kind="stable")
+    lowest = np.take_along_axis(np.nan_to_num(matrix), order, axis=1)
+    dropped = np.where(np.arange(n_races) < n_drop[:, None], lowest, 0.0).sum(axis=1)
+    total = np.nansum(matrix, axis=1) - dropped
+    best = finishes.min(axis=1)
+    
+    # Count-back table: how many times each rider finished 1st, 2nd, ...
+    countback = np.bincount(
+        riders[scoring] * len(table) + positions[scoring].astype(int) - 1,
+        minlength=n_riders * len(table),
+    ).reshape(n_riders, len(table))
+    
+    # Factorize codes follow first appearance, so writing the row numbers in
+    # reverse leaves each rider's first row
+    first_row = np.empty(n_riders, dtype=np.int64)
+    first_row[riders[::-1]] = np.arange(len(riders))[::-1]
+    rider_category = category_codes[first_row]
+    rider_number = race_numbers[first_row]
+    first_names = results["FirstName"].to_numpy()[first_row]
+    last_names = results["LastName"].to_numpy()[first_row]
+    ranking = np.lexsort((rider_number, best, *(-countback[:, ::-1].T), -total, rider_category))
+    
+    standings = {}
+    bounds = np.searchsorted(rider_category[ranking], np.arange(len(category_names) + 1))
+    for code, category in enumerate(category_names):
+        rows = ranking[bounds[code]:bounds[code + 1]]
+        frame = {
+            "FinalPosition": np.arange(1, len(rows) + 1),
+            "RaceNumber": rider_number[rows],
+            "FirstName": first_names[rows],
+            "LastName": last_names[rows],
+            "TotalPoints": total[rows],
+            "RacesParticipated": participated[rows],
+            "BestPosition": np.where(np.isinf(best[rows]), 0, best[rows]).astype(int),
+            "WorstResultDropped": np.where(dropped[rows] > 0, dropped[rows], np.nan),
+            "WorstRace": np.where(n_drop[rows] > 0, race_names.to_numpy()[order[rows, 0]], None),
+        }
+        for k in np.flatnonzero(started[rows].any(axis=0)):
+            frame[f"Race_{race_names[k]}"] = np.nan_to_num(matrix[rows, k])
+        standings[category] = pd.DataFrame(frame)
+    return standings
+
+def _implied_positions(values, points_table):
+    """Finishing positions implied by race points (inf where points aren't in the table)"""
+    table = np.asarray(points_table, dtype=float)
+    match = values[..., None] == table
+    return np.where(match.any(axis=-1), match.argmax(axis=-1) + 1, np.inf)
+
+def update_standings(frame, rounds, race=None, results=None, previous=None, history=None,
+                     points_table=POINTS_TABLE, drop_worst=DROP_WORST):
+    """Apply one race's results for a category to its standings incrementally.
+
+    frame is the category's current standings in the results CSV layout,
+    ordered by FinalPosition. results replaces the category's finishing
+    order for race (None leaves the races as they are, for when only
+    rounds changed); previous is the finishing order it replaces, which
+    must be given when the race is already in the frame, since the CSV
+    layout can't tell who finished it without points. history holds the
+    category's results in the other races, when the season keeps them.
+
+    Only affected riders are rescored: those in results or previous, plus
+    riders at the drop threshold, whose dropped results depend on rounds.
+    The CSV layout doesn't record 0-point starts, so those are taken to be
+    a rider's first races without points. Positions are then re-ranked only
+    in the window the rescored riders can move through, with the
+    compute_standings tie-breaks (count-back recovered from the points).
+    Returns (new frame, number of riders whose standing changed).
+    """
+    table = np.asarray(points_table, dtype=float)
+    df = frame.copy()
+    n_old = len(df)
+    old_totals = frame["TotalPoints"].to_numpy(dtype=float)
+    touched = np.zeros(0, dtype=np.int64)
+    
+    if results is not None:
+        column = f"Race_{race}"
+        positions, points = race_points(results, points_table)
+        numbers = results["RaceNumber"].to_numpy(dtype=np.int64)
+        
+        # New riders join at the bottom with no results yet
+        joining = ~np.isin(numbers, df["RaceNumber"].to_numpy(dtype=np.int64))
+        if joining.any():
+            df = pd.concat([df, pd.DataFrame({
+                "FinalPosition": np.arange(n_old + 1, n_old + joining.sum() + 1),
+                "RaceNumber": numbers[joining],
+                "FirstName": results["FirstName"].to_numpy()[joining],
+                "LastName": results["LastName"].to_numpy()[joining],
+                "TotalPoints": 0.0,
+                "RacesParticipated": 0,
+                "BestPosition": 0,
+            })], ignore_index=True)
+        if column not in df:
+            df[column] = 0.0
+        race_cols = sorted(c for c in df.columns if c.startswith("Race_"))
+        df = df[[c for c in df.columns if not c.startswith("Race_")] + race_cols]
+        df[race_cols] = df[race_cols].fillna(0.0)
+        
+        index = pd.Index(df["RaceNumber"])
+        rows = index.get_indexer(numbers)
+        if previous is not None and len(previous):
+            previous_positions, _ = race_points(previous, points_table)
+            previous_rows = index.get_indexer(previous["RaceNumber"].to_numpy(dtype=np.int64))
+            previous_positions = previous_positions[previous_rows >= 0]
+            previous_rows = previous_rows[previous_rows >= 0]
+        elif column in frame and (frame[column].fillna(0) != 0).any():
+            raise ValueError(f"{race} is already scored for this category and its previous results "
+                             f"aren't recorded; recompute the season with `standings` instead")
+        else:
+            previous_rows = previous_positions = np.zeros(0, dtype=np.int64)
+        touched = np.union1d(rows, previous_rows)
+        
+        started_before = np.zeros(len(df), dtype=np.int64)
+        started_before[previous_rows] = 1
+        started_now = np.zeros(len(df), dtype=np.int64)
+        started_now[rows] = 1
+        df["RacesParticipated"] = df["RacesParticipated"].to_numpy(dtype=np.int64) + started_now - started_before
+        race_values = np.zeros(len(df))
+        race_values[rows] = points
+        df[column] = race_values
+        
+        # Best position: the old best unless it came from this race, in which
+        # case the best finish in the other races. That is exact for riders
+        # whose other results are all in history; otherwise finishes outside
+        # the points can't be recovered and the best scoring finish is used
+        position_before = np.full(len(df), np.inf)
+        position_before[previous_rows] = np.nan_to_num(previous_positions, nan=np.inf)
+        position_now = np.full(len(df), np.inf)
+        position_now[rows] = np.nan_to_num(positions, nan=np.inf)
+        best = df["BestPosition"].to_numpy(dtype=float)[touched]
+        best[best == 0] = np.inf
+        others = [c for c in race_cols if c != column]
+        implied = _implied_positions(df[others].to_numpy(dtype=float)[touched], points_table).min(axis=1, initial=np.inf)
+        if history is not None and len(history):
+            finishes = pd.to_numeric(history["Position"], errors="coerce")
+            by_rider = finishes.where(finishes >= 1).groupby(history["RaceNumber"].to_numpy(dtype=np.int64))
+            touched_numbers = df["RaceNumber"].to_numpy(dtype=np.int64)[touched]
+            known_best = by_rider.min().reindex(touched_numbers).fillna(np.inf).to_numpy(dtype=float)
+            known_starts = by_rider.size().reindex(touched_numbers).fillna(0).to_numpy(dtype=np.int64)
+            complete = known_starts == df["RacesParticipated"].to_numpy(dtype=np.int64)[touched] - started_now[touched]
+            implied = np.where(complete, known_best, np.minimum(implied, known_best))
+        best = np.minimum(np.where(best != position_before[touched], best, implied), position_now[touched])
+        best_positions = df["BestPosition"].to_numpy(dtype=np.int64).copy()
+        best_positions[touched] = np.where(np.isinf(best), 0, best)
+        df["BestPosition"] = best_positions
+    
+    race_cols = [c for c in df.columns if c.startswith("Race_")]
+    participated = df["RacesParticipated"].to_numpy(dtype=np.int64)
+    n_drop = np.clip(participated - (rounds - drop_worst), 0, drop_worst)
+    at_threshold = np.flatnonzero((n_drop > 0) | df["WorstRace"].notna().to_numpy())
+    rescored = np.union1d(touched, at_threshold)
+    
+    # Which races each rescored rider started: every race with points, this
+    # race's starters, and as many of their pointless races as still
+    # unaccounted for
+    values = df[race_cols].to_numpy(dtype=float)[rescored]
+    started = values > 0
+    unknown = ~started
+    if results is not None:
+        exact = race_cols.index(column)
+        started[:, exact] = started_now[rescored] > 0
+        unknown[:, exact] = False
+    missing = participated[rescored] - started.sum(axis=1)
+    started |= unknown & (np.cumsum(unknown, axis=1) <= missing[:, None])
+    
+    n_drop = n_drop[rescored]
+    order = np.argsort(np.where(started, values, np.inf), axis=1, kind="stable")
+    lowest = np.take_along_axis(values, order, axis=1)
+    dropped = np.where(np.arange(len(race_cols)) < n_drop[:, None], lowest, 0.0).sum(axis=1)
+    race_names = np.array([c[len("Race_"):] for c in race_cols], dtype=object)
+    for name, update in (
+        ("TotalPoints", values.sum(axis=1) - dropped),
+        ("WorstResultDropped", np.where(dropped > 0, dropped, np.nan)),
+        ("WorstRace", np.where(n_drop > 0, race_names[order[:, 0]], None)),
+    ):
+        column_values = df[name].to_numpy(dtype=object if name == "WorstRace" else float).copy()
+        column_values[rescored] = update
+        df[name] = column_values
+    
+    # Keep only the riders whose standing really changed
+    changed = rescored[rescored >= n_old]
+    kept = rescored[rescored < n_old]
+    same = np.ones(len(kept), dtype=bool)
+    for name in df.columns:
+        if name == "FinalPosition":
+            continue
+        new = df[name].to_numpy()[kept]
+        if name not in frame:
+            same &= new == 0
+            continue
+        old = frame[name].to_numpy()[kept]
+        same &= (old == new) | (pd.isna(old) & pd.isna(new))
+    changed = np.concatenate([kept[~same], changed])
+    if not len(changed):
+        return frame, 0
     
-    df = pd.read_csv(csv_path)
-    return df
+    # Ranks outside [lo, hi) can't change: riders above it all beat every
+    # changed total and riders below it all trail them
+    totals = df["TotalPoints"].to_numpy(dtype=float)[changed]
+    lo = min(changed.min(), np.searchsorted(-old_totals, -totals.max(), side="left"))
+    hi = max(changed.max() + 1, np.searchsorted(-old_totals, -totals.min(), side="right"))
+    window = np.arange(lo, hi)
+    values = df[race_cols].to_numpy(dtype=float)[window]
+    countback = (values[..., None] == table).sum(axis=1)
+    best = df["BestPosition"].to_numpy(dtype=float)[window]
+    best[best == 0] = np.inf
+    ranking = np.lexsort((df["RaceNumber"].to_numpy()[window], best,
+                          *(-countback[:, ::-1].T), -df["TotalPoints"].to_numpy()[window]))
+    df = df.iloc[np.concatenate([np.arange(lo), window[ranking], np.arange(hi, len(df))])].reset_index(drop=True)
+    final_positions = df["FinalPosition"].to_numpy(dtype=np.int64).copy()
+    final_positions[lo:hi] = np.arange(lo + 1, hi + 1)
+    df["FinalPosition"] = final_positions
+    return df, len(changed)
 
 def get_race_columns(df):
     """Extract race column names from the dataframe and sort them by race order"""
@@ -171,6 +1329,185 @@ def get_race_columns(df):
     race_cols.sort(key=sort_key)
     return race_cols
 
+@dataclass
+class Progression:
+    """A category's standings after each round, one row per rider (in table order)"""
+    races: list
+    points: np.ndarray
+    cumulative: np.ndarray
+    rank: np.ndarray
+    gap: np.ndarray
+    # Places gained (positive) or lost since the previous round; 0 in round one
+    movement: np.ndarray
+
+def round_progression(df):
+    """Cumulative points, rank, gap to the leader and movement after every round.
+
+    Rounds follow get_race_columns() order. Round k+1's totals are round k's
+    plus that round's points (a running sum across the rounds), and each
+    round's totals are then ranked, so every round of every rider comes out
+    of one vectorized pass. With DROP_WORST=1 nobody can have started
+    enough rounds to drop a result before the last one, so the running sums
+    are the standings, with tied riders sharing a rank (with more dropped
+    results, rounds just before the last show totals before drops). The
+    last round is the final standings themselves: TotalPoints with the
+    worst result dropped and FinalPosition with the compute_standings
+    tie-breaks.
+    """
+    races = get_race_columns(df)
+    points = df[races].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    cumulative = np.cumsum(np.nan_to_num(points), axis=1)
+    rank = pd.DataFrame(cumulative).rank(ascending=False, method="min").to_numpy(dtype=int).copy() \
+        if len(df) else np.zeros(cumulative.shape, dtype=int)
+    if races:
+        cumulative[:, -1] = df["TotalPoints"].to_numpy(dtype=float)
+        rank[:, -1] = df["FinalPosition"].to_numpy(dtype=int)
+    gap = (cumulative.max(axis=0) if len(df) else 0) - cumulative
+    movement = np.zeros_like(rank)
+    movement[:, 1:] = rank[:, :-1] - rank[:, 1:]
+    return Progression(races, points, cumulative, rank, gap, movement)
+
+def write_standings(season_dir, standings):
+    """Write computed standings as the season's category CSVs.
+
+    Each file is replaced atomically, so running workers reload a complete
+    file on their next check.
+    """
+    for category, frame in standings.items():
+        path = Path(season_dir) / f"{category}.csv"
+        staging = path.with_name(f".{path.name}.tmp")
+        frame.to_csv(staging, index=False)
+        os.replace(staging, path)
+
+def apply_race_result(season, category, race, results):
+    """Publish one race's finishing order for one category of a season.
+
+    The category's standings are updated incrementally and its cached
+    renders dropped; other categories are only touched when race is a new
+    round for the season, since that moves everyone's drop threshold. If
+    races/<race>.csv is created or updated too, so the next correction of
+    the race knows whom it replaces and a full `standings` recompute
+    agrees. A race already scored in the category CSV without such a file
+    can't be corrected incrementally (ValueError). Returns {category:
+    riders changed}.
+    """
+    store = season_catalog.get(season)
+    if store is None:
+        raise ValueError(f"Unknown season {season}")
+    frames = {c: store.get(c) for c in store.categories}
+    known = {col for df in frames.values() if df is not None for col in df.columns if col.startswith("Race_")}
+    new_round = f"Race_{race}" not in known
+    rounds = len(known) + new_round
+    
+    race_file = store.results_path / "races" / f"{race}.csv"
+    earlier = pd.read_csv(race_file) if race_file.exists() else None
+    previous = earlier[earlier["Category"] == category] if earlier is not None else None
+    history = load_race_results(store.results_path)
+    if history is not None:
+        history = history[(history["Category"] == category) & (history["Race"] != race)]
+    
+    changed = {}
+    for c, df in frames.items():
+        if c == category:
+            if df is None:
+                df = pd.DataFrame({name: [] for name in STANDINGS_COLUMNS})
+            df, riders = update_standings(df, rounds, race, results, previous, history)
+        elif df is not None and new_round:
+            df, riders = update_standings(df, rounds)
+        else:
+            continue
+        if riders:
+            store.update(c, df)
+            render_cache.invalidate((season, c))
+            changed[c] = riders
+    
+    race_file.parent.mkdir(exist_ok=True)
+    rows = results.assign(Category=category)[[*RACE_RESULT_COLUMNS, *(["Points"] if "Points" in results else [])]]
+    if earlier is not None:
+        rows = pd.concat([earlier[earlier["Category"] != category], rows], ignore_index=True)
+    staging = race_file.with_name(f".{race_file.name}.tmp")
+    rows.to_csv(staging, index=False)
+    os.replace(staging, race_file)
+    return changed
+
+# The default season is what the bare / page shows, so load it up front
+if season_catalog.get(resolve_season()) is not None:
+    season_catalog.get(resolve_season()).load_all()
+
+# Maximum number of rendered fragments/pages kept in memory
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "64"))
+
+class RenderCache:
+    """LRU cache of rendered HTML keyed by (kind, category, data version, *extra).
+
+    Storing a new data version for a (kind, category) pair evicts the entries
+    rendered from older versions, so stale HTML never outlives its data.
+    """
+
+    def __init__(self, maxsize=RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_render(self, kind, category, version, render, extra=()):
+        """Return cached bytes for the key, calling render() to build them on a miss"""
+        key = (kind, category, version, *extra)
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return body
+            self.misses += 1
+        body = render()
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        with self._lock:
+            stale = [k for k in self._entries
+                     if k[0] == kind and k[1] == category and k[2] != version]
+            for k in stale:
+                del self._entries[k]
+            self._entries[key] = body
+            self.evictions += len(stale)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return body
+
+    def invalidate(self, category=None):
+        """Drop every entry for a category (or everything)"""
+        with self._lock:
+            keys = [k for k in self._entries if category is None or k[1] == category]
+            for k in keys:
+                del self._entries[k]
+            self.evictions += len(keys)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": sum(len(v) for v in self._entries.values()),
+            }
+
+render_cache = RenderCache()
+
+# Rider profiles get their own, smaller cache: there is one per rider, so a
+# crawler walking /rider/<number> would otherwise evict the hot leaderboards
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "32"))
+profile_cache = RenderCache(PROFILE_CACHE_SIZE)
+
+# Places rendered per window of a live leaderboard; further windows load on scroll
+LEADERBOARD_PAGE_SIZE = int(os.getenv("LEADERBOARD_PAGE_SIZE", "100"))
+LEADERBOARD_MAX_PAGE_SIZE = 500
+# Position, Number, Rider, Total Points, Races, Best Pos, Worst Dropped, Worst Race
+LEADERBOARD_FIXED_COLUMNS = 8
+
 def format_race_name(race_col):
     """Format race column name for display"""
     name = race_col.replace('Race_', '').replace('_', ' ')
@@ -192,8 +1529,183 @@ def create_position_badge(position):
         cls=f"inline-flex items-center justify-center w-10 h-10 rounded-full font-bold text-base {badge_class}"
     )
 
-def create_leaderboard_table(df, category):
-    """Create the leaderboard table with Tailwind styling"""
+# Badge classes for race scores (25 points typically means 1st place)
+SCORE_TIER_CLASSES = {
+    "top": "px-2 py-1 bg-green-500/10 text-green-400 rounded font-semibold text-sm",
+    "regular": "px-2 py-1 bg-blue-500/10 text-blue-400 rounded text-sm",
+}
+
+def _format_points(values):
+    """Format a numeric column like f"{x:.0f}", using "—" for missing values"""
+    values = pd.to_numeric(values, errors="coerce")
+    missing = values.isna().to_numpy()
+    text = np.round(values.fillna(0).to_numpy()).astype(np.int64).astype(str)
+    return np.where(missing, "—", text).astype(object), missing
+
+def _is_blank(values):
+    """True where a column value is NaN or an empty string"""
+    return (values.isna() | (values.astype(str) == "")).to_numpy()
+
+def leaderboard_display_columns(df, race_cols):
+    """Compute every display string and CSS class of the leaderboard column-wise"""
+    n = len(df)
+    missing_col = pd.Series([np.nan] * n, index=df.index, dtype=object)
+    
+    cols = {
+        "position": df['FinalPosition'].astype(int).to_numpy(),
+        "number": df['RaceNumber'].astype(int).astype(str).to_numpy(),
+        "name": (df['FirstName'].astype(str) + " " + df['LastName'].astype(str)).to_numpy(),
+        "total": _format_points(df['TotalPoints'])[0],
+        "races": df['RacesParticipated'].astype(int).astype(str).to_numpy(),
+        "best": df['BestPosition'].astype(int).astype(str).to_numpy(),
+    }
+    
+    # Worst result dropped
+    worst_dropped = df['WorstResultDropped'] if 'WorstResultDropped' in df else missing_col
+    dropped_text, _ = _format_points(worst_dropped)
+    blank = _is_blank(worst_dropped)
+    cols["worst_dropped"] = np.where(blank, "—", dropped_text)
+    cols["worst_dropped_class"] = np.where(blank, "text-slate-500", "text-red-400")
+    
+    # Worst race
+    worst_race = df['WorstRace'] if 'WorstRace' in df else missing_col
+    blank = _is_blank(worst_race)
+    race_text = worst_race.astype(str).str.replace('_', ' ').str.title().to_numpy()
+    cols["worst_race"] = np.where(blank, "—", race_text)
+    cols["worst_race_class"] = np.where(blank, "text-slate-500", "text-red-400 text-xs")
+    
+    # Per-race scores and their tier: empty (missing or 0), top (>= 25) or regular
+    cols["race_text"] = {}
+    cols["race_tier"] = {}
+    for race_col in race_cols:
+        scores = pd.to_numeric(df[race_col], errors="coerce")
+        text, missing = _format_points(scores)
+        empty = missing | (scores == 0).to_numpy()
+        top = (scores >= 25).to_numpy()
+        cols["race_text"][race_col] = np.where(empty, "—", text)
+        cols["race_tier"][race_col] = np.select([empty, top], ["empty", "top"], "regular")
+    
+    return cols
+
+# Placeholder used to split a rendered FT component into reusable markup
+_SLOT = "\ue000"
+
+def _ft_template(ft):
+    """Render an FT component around _SLOT and return its (prefix, suffix) markup"""
+    prefix, suffix = to_xml(ft, indent=False).split(_SLOT)
+    return prefix, suffix
+
+def leaderboard_rows_html(cols, race_cols, start=1):
+    """Emit the <tr> markup for every rider by zipping the precomputed columns.
+
+    Each cell is rendered from its FT component once, either as a template
+    the row values are spliced into or, for cells that repeat across riders
+    (top-3 badges, worst-race text, race scores), as a memoized string.
+    """
+    # Rows are addressable by place (lb-row-1, lb-row-2, ...) for live updates
+    row_id, row_open, row_close = to_xml(Tr(
+        _SLOT, id=f"lb-row-{_SLOT}", cls="border-b border-slate-700/50 hover:bg-blue-500/5 transition-colors duration-200"
+    ), indent=False).split(_SLOT)
+    badge_open, badge_close = _ft_template(Td(create_position_badge(_SLOT), cls="text-center px-3 py-4"))
+    number_open, number_close = _ft_template(Td(Strong(_SLOT), cls="px-3 py-4 font-bold text-slate-200"))
+    name_open, name_close = _ft_template(Td(_SLOT, cls="px-3 py-4 text-slate-200 min-w-[150px]"))
+    total_open, total_close = _ft_template(Td(
+        Span(_SLOT, cls="px-3 py-1 gradient-bg rounded-full font-bold text-sm text-white"),
+        cls="text-center px-3 py-4"
+    ))
+    count_open, count_close = _ft_template(Td(_SLOT, cls="text-center px-3 py-4 text-slate-300"))
+    
+    shared = {}
+    def shared_cell(key, build):
+        markup = shared.get(key)
+        if markup is None:
+            markup = shared[key] = to_xml(build(), indent=False)
+        return markup
+    
+    def score_cell(text, tier):
+        if tier == "empty":
+            return Td(text, cls="text-center px-3 py-4 text-slate-500")
+        return Td(Span(text, cls=SCORE_TIER_CLASSES[tier]), cls="text-center px-3 py-4")
+    
+    race_cells = zip(*(zip(cols["race_text"][c], cols["race_tier"][c]) for c in race_cols)) \
+        if race_cols else [()] * len(cols["position"])
+    
+    rows = []
+    for place, (position, number, name, total, races, best,
+                dropped, dropped_cls, worst, worst_cls, scores) in enumerate(zip(
+            cols["position"], cols["number"], cols["name"], cols["total"],
+            cols["races"], cols["best"], cols["worst_dropped"], cols["worst_dropped_class"],
+            cols["worst_race"], cols["worst_race_class"], race_cells), start=start):
+        if position in (1, 2, 3):
+            badge = shared_cell(("badge", position), lambda: Td(create_position_badge(position), cls="text-center px-3 py-4"))
+        else:
+            badge = f"{badge_open}{position}{badge_close}"
+        parts = [
+            row_id, str(place), row_open,
+            badge,
+            number_open, number, number_close,
+            name_open, escape(name, quote=False), name_close,
+            total_open, total, total_close,
+            count_open, races, count_close,
+            count_open, best, count_close,
+            shared_cell(("dropped", dropped, dropped_cls), lambda: Td(dropped, cls=f"text-center px-3 py-4 {dropped_cls} font-semibold")),
+            shared_cell(("worst", worst, worst_cls), lambda: Td(worst, cls=f"text-center px-3 py-4 {worst_cls}")),
+        ]
+        parts.extend(shared_cell(("score", text, tier), lambda: score_cell(text, tier)) for text, tier in scores)
+        parts.append(row_close)
+        rows.append("".join(parts))
+    return rows
+
+def leaderboard_window(offset=0, limit=None, total=0):
+    """Snap requested ?offset=&limit= to a window of whole pages within a table of total places.
+
+    Windows are cached and precompressed, so only a bounded set of them may
+    exist: offsets round down to a page boundary (at most the last page)
+    and limits up to whole pages, at most LEADERBOARD_MAX_PAGE_SIZE.
+    """
+    page = LEADERBOARD_PAGE_SIZE
+    last_page = max(total - 1, 0) // page * page
+    offset = min(max(offset or 0, 0) // page * page, last_page)
+    pages = 1 if limit is None else -(-max(limit, 1) // page)
+    limit = max(min(pages * page, LEADERBOARD_MAX_PAGE_SIZE // page * page), page)
+    return offset, limit
+
+def leaderboard_more_row(season, category, offset, limit, colspan):
+    """Placeholder row that loads the next window of places when scrolled into view.
+
+    Without htmx it is a plain link to the page showing that window.
+    """
+    return to_xml(Tr(
+        Td(
+            A("Show more riders", href=f"{page_url(category, season)}&offset={offset}&limit={limit}",
+              cls="text-blue-400 font-semibold hover:text-blue-300"),
+            colspan=colspan, cls="text-center px-3 py-4"
+        ),
+        id="lb-more",
+        hx_get=f"/leaderboard/rows?season={season}&category={category}&offset={offset}&limit={limit}",
+        hx_trigger="revealed", hx_swap="outerHTML"
+    ), indent=False)
+
+def leaderboard_window_rows(df, category, season, offset=0, limit=None):
+    """Rows for places offset+1 .. offset+limit, plus a loader row when more follow.
+
+    Only the riders in the window are formatted and rendered; limit=None
+    emits every rider from offset on.
+    """
+    race_cols = get_race_columns(df)
+    end = len(df) if limit is None else offset + limit
+    window = df.iloc[offset:end]
+    rows = leaderboard_rows_html(leaderboard_display_columns(window, race_cols), race_cols, start=offset + 1)
+    if end < len(df):
+        rows.append(leaderboard_more_row(season, category, end, limit, LEADERBOARD_FIXED_COLUMNS + len(race_cols)))
+    return rows
+
+def create_leaderboard_table(df, category, season=None, offset=0, limit=None):
+    """Create the leaderboard table with Tailwind styling.
+
+    With a limit only that window of places is rendered; the rest load as
+    the visitor scrolls (see leaderboard_more_row).
+    """
     if df is None or df.empty:
         return Div(
             P("No data available for this category.", cls="text-center text-slate-400 p-8"),
@@ -218,64 +1730,8 @@ def create_leaderboard_table(df, category):
     for race_col in race_cols:
         headers.append(Th(format_race_name(race_col), cls="text-center px-3 py-3 text-slate-400 uppercase text-xs font-semibold tracking-wider border-b-2 border-slate-700"))
     
-    # Table rows with Tailwind styling
-    rows = []
-    for _, row in df.iterrows():
-        # Handle worst result dropped
-        worst_dropped = row.get('WorstResultDropped', '')
-        if pd.isna(worst_dropped) or worst_dropped == '':
-            worst_dropped_display = "—"
-            worst_dropped_class = "text-slate-500"
-        else:
-            worst_dropped_display = f"{float(worst_dropped):.0f}"
-            worst_dropped_class = "text-red-400"
-        
-        # Handle worst race
-        worst_race = row.get('WorstRace', '')
-        if pd.isna(worst_race) or worst_race == '':
-            worst_race_display = "—"
-            worst_race_class = "text-slate-500"
-        else:
-            worst_race_display = str(worst_race).replace('_', ' ').title()
-            worst_race_class = "text-red-400 text-xs"
-        
-        cells = [
-            Td(create_position_badge(int(row['FinalPosition'])), cls="text-center px-3 py-4"),
-            Td(Strong(str(int(row['RaceNumber']))), cls="px-3 py-4 font-bold text-slate-200"),
-            Td(f"{row['FirstName']} {row['LastName']}", cls="px-3 py-4 text-slate-200 min-w-[150px]"),
-            Td(
-                Span(
-                    f"{row['TotalPoints']:.0f}", 
-                    cls="px-3 py-1 gradient-bg rounded-full font-bold text-sm text-white"
-                ), 
-                cls="text-center px-3 py-4"
-            ),
-            Td(str(int(row['RacesParticipated'])), cls="text-center px-3 py-4 text-slate-300"),
-            Td(str(int(row['BestPosition'])), cls="text-center px-3 py-4 text-slate-300"),
-            Td(worst_dropped_display, cls=f"text-center px-3 py-4 {worst_dropped_class} font-semibold"),
-            Td(worst_race_display, cls=f"text-center px-3 py-4 {worst_race_class}"),
-        ]
-        
-        # Add race scores with Tailwind styling
-        for race_col in race_cols:
-            score = row[race_col]
-            if pd.isna(score) or score == 0:
-                cells.append(Td("—", cls="text-center px-3 py-4 text-slate-500"))
-            else:
-                # Check if this is the best score (25 points typically means 1st place)
-                if score >= 25:
-                    score_badge = Span(
-                        f"{score:.0f}", 
-                        cls="px-2 py-1 bg-green-500/10 text-green-400 rounded font-semibold text-sm"
-                    )
-                else:
-                    score_badge = Span(
-                        f"{score:.0f}", 
-                        cls="px-2 py-1 bg-blue-500/10 text-blue-400 rounded text-sm"
-                    )
-                cells.append(Td(score_badge, cls="text-center px-3 py-4"))
-        
-        rows.append(Tr(*cells, cls="border-b border-slate-700/50 hover:bg-blue-500/5 transition-colors duration-200"))
+    # Table rows with Tailwind styling, emitted from precomputed columns
+    rows = leaderboard_window_rows(df, category, season, offset, limit)
     
     return Div(
         Div(
@@ -288,7 +1744,7 @@ def create_leaderboard_table(df, category):
         Div(
             Table(
                 Thead(Tr(*headers), cls="bg-blue-500/5 sticky top-0 z-10"),
-                Tbody(*rows),
+                Tbody(NotStr("".join(rows)), id="leaderboard-rows"),
                 cls="w-full border-collapse"
             ),
             cls="w-full overflow-x-auto"
@@ -296,15 +1752,423 @@ def create_leaderboard_table(df, category):
         cls="bg-slate-800 rounded-xl shadow-2xl border border-slate-700 overflow-hidden animate-fade-in"
     )
 
+def render_leaderboard_table(df, category, version, season, offset=0, limit=None):
+    """Rendered HTML for a window of a category's leaderboard table, cached per data version"""
+    return render_cache.get_or_render(
+        "table", (season, category), version,
+        lambda: to_xml(create_leaderboard_table(df, category, season, offset, limit)),
+        extra=(offset, limit),
+    )
+
+# Pages are cached by browsers/proxies only after revalidating with us, so
+# every view still reaches track_visit() (as a cheap 304 when unchanged).
+# A positive PAGE_CACHE_MAX_AGE lets shared caches serve pages without asking,
+# trading visit-count accuracy for load.
+PAGE_CACHE_MAX_AGE = int(os.getenv("PAGE_CACHE_MAX_AGE", "0"))
+
+# Changes whenever the page markup (this file) or the stylesheet changes
+TEMPLATE_VERSION = hashlib.sha1(Path(__file__).read_bytes() + STYLESHEET).hexdigest()[:8]
+TEMPLATE_MTIME = max(Path(__file__).stat().st_mtime,
+                     STYLESHEET_PATH.stat().st_mtime if STYLESHEET_PATH.exists() else 0)
+
+def page_cache_headers(season, category, version, data_modified=None):
+    """ETag, Last-Modified and Cache-Control headers for a season's category page.
+
+    data_modified (epoch seconds) replaces the category's file mtime for
+    views that draw on several categories.
+    """
+    store = season_catalog.get(season)
+    if data_modified is None and store is not None:
+        data_modified = store.last_modified(category)
+    last_modified = max(data_modified or 0, TEMPLATE_MTIME)
+    if PAGE_CACHE_MAX_AGE > 0:
+        cache_control = f"public, max-age={PAGE_CACHE_MAX_AGE}, must-revalidate"
+    else:
+        cache_control = "public, no-cache"
+    return {
+        "ETag": f'"{season}-{category}-{version or "none"}-{TEMPLATE_VERSION}{season_catalog.version()}"',
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+# Content codings we precompress pages into, in order of preference
+PAGE_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Brotli quality for responses compressed on a cache miss, inside the
+# request; files written ahead of time (static export, stylesheet) use 11
+PAGE_BROTLI_QUALITY = int(os.getenv("PAGE_BROTLI_QUALITY", "5"))
+
+def compress(body, encoding, best=False):
+    """Compress a rendered page; the result is cached per data version.
+
+    Brotli runs at a moderate quality unless best is set, since quality 11
+    costs ~100 ms on a large page.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if best else PAGE_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+def choose_encoding(request):
+    """Pick the preferred precompressed variant the client accepts (None = identity)"""
+    accepted = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    for encoding in PAGE_ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+def is_not_modified(request, headers):
+    """True if the request's conditional headers match the current page"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence and uses weak comparison
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or headers["ETag"] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(parsedate_to_datetime(headers["Last-Modified"]).timestamp()) <= since
+    return False
+
+_stylesheet_variants = {None: STYLESHEET, **{e: compress(STYLESHEET, e, best=True) for e in PAGE_ENCODINGS}}
+
+@rt(STYLESHEET_URL)
+def stylesheet(request):
+    """The fingerprinted stylesheet, cached by clients for a year"""
+    encoding = choose_encoding(request)
+    headers = {
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "ETag": f'"{STYLESHEET_VERSION}{"-" + encoding if encoding else ""}"',
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(_stylesheet_variants[encoding], media_type="text/css", headers=headers)
+
+# Must take precedence over FastHTML's catch-all static file route
+app.router.routes.insert(0, app.router.routes.pop())
+
 @rt("/health")
 def health():
     """Health check endpoint for monitoring"""
     return {
-        "status": "healthy",
-        "service": "bgx-navigation-dashboard",
-        "version": "1.0.0"
+        "status": "healthy",
+        "service": "bgx-navigation-dashboard",
+        "version": "1.0.0"
+    }
+
+@rt("/metrics")
+def metrics():
+    """Internal counters for monitoring cache behaviour"""
+    return {
+        "standings": season_catalog.stats(),
+        "render_cache": render_cache.stats(),
+        "profile_cache": profile_cache.stats(),
+        "visits": visit_writer.stats(),
+        "retention": visit_retention.stats(),
+        "live": live_hub.stats(),
+        "search": rider_search.stats(),
+    }
+
+# Bucket sizes for windowed visit statistics, as ISO timestamp prefix lengths
+VISIT_BUCKETS = {"minute": 16, "hour": 13, "day": 10}
+
+# Display labels for the pages track_visit records
+VISIT_PAGES = {
+    "home": "🏠 Home",
+    "stats": "📊 Stats",
+    "rider": "🏍️ Rider",
+    "progression": "🏁 Progression",
+}
+
+def parse_visit_window(start=None, end=None, default=timedelta(hours=24)):
+    """Parse ISO 'from'/'to' strings into naive local datetimes.
+
+    Missing bounds default to the last 24 hours; timezone-aware values are
+    converted to local time to match the stored visit timestamps. Raises
+    ValueError for malformed or inverted windows.
+    """
+    def parse(value):
+        dt = datetime.fromisoformat(value)
+        if dt.tzinfo is not None:
+            dt = dt.astimezone().replace(tzinfo=None)
+        return dt
+    end = parse(end) if end else datetime.now()
+    start = parse(start) if start else end - default
+    if start >= end:
+        raise ValueError("'from' must be before 'to'")
+    return start, end
+
+def visit_window(start, end, bucket="hour"):
+    """Visit counts in [start, end) per bucket, broken down by page, category and device.
+
+    Hour/day queries read the whole hours of the window from visit_rollup
+    and scan the raw visit table only for the partial hours at either end;
+    minute queries are a range scan on the visit timestamp index.
+    """
+    width = VISIT_BUCKETS[bucket]
+    conn = get_db().conn
+    
+    def scan(lo, hi):
+        return conn.execute(
+            f"SELECT substr(timestamp, 1, {width}), COALESCE(page, ''), COALESCE(category, ''), "
+            "COALESCE(device_type, 'unknown'), COUNT(*) "
+            "FROM visit WHERE timestamp >= ? AND timestamp < ? GROUP BY 1, 2, 3, 4",
+            (lo.isoformat(), hi.isoformat()),
+        ).fetchall()
+    
+    first_hour = start.replace(minute=0, second=0, microsecond=0)
+    if first_hour < start:
+        first_hour += timedelta(hours=1)
+    last_hour = end.replace(minute=0, second=0, microsecond=0)
+    if bucket == "minute" or first_hour >= last_hour:
+        rows = scan(start, end)
+    else:
+        rows = conn.execute(
+            f"SELECT substr(bucket, 1, {width}), page, category, device_type, SUM(count) "
+            "FROM visit_rollup WHERE bucket >= ? AND bucket < ? GROUP BY 1, 2, 3, 4",
+            (rollup_bucket(first_hour.isoformat()), rollup_bucket(last_hour.isoformat())),
+        ).fetchall()
+        if start < first_hour:
+            rows += scan(start, first_hour)
+        if last_hour < end:
+            rows += scan(last_hour, end)
+    
+    suffix = ":00" if bucket == "hour" else ""
+    buckets = {}
+    totals = {"total": 0, "pages": Counter(), "categories": Counter(), "devices": Counter()}
+    for key, page, category, device_type, count in rows:
+        label = key + suffix
+        entry = buckets.setdefault(label, {
+            "bucket": label, "total": 0,
+            "pages": Counter(), "categories": Counter(), "devices": Counter(),
+        })
+        for target in (entry, totals):
+            target["total"] += count
+            target["pages"][page] += count
+            target["devices"][device_type] += count
+            # Category popularity is a share of home visits, as in visit_summary
+            if category and page == "home":
+                target["categories"][category] += count
+    
+    return {
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "bucket": bucket,
+        **totals,
+        "buckets": [buckets[label] for label in sorted(buckets)],
     }
 
+def visit_summary(recent_limit=20, start=None, end=None):
+    """Visit counts by page, device and category plus the most recent visits.
+
+    Counts are summed from the hourly visit_rollup table and the recent
+    visits come from the timestamp index, so the cost is O(buckets) rather
+    than O(visits). Passing start/end restricts everything to that window.
+    """
+    if start is not None:
+        window = visit_window(start, end, "day")
+        recent = [
+            Visit(id=row[0], timestamp=row[1], page=row[2], category=row[3], device_type=row[4])
+            for row in get_db().conn.execute(
+                "SELECT id, timestamp, page, category, device_type FROM visit "
+                "WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp DESC LIMIT ?",
+                (start.isoformat(), end.isoformat(), recent_limit)
+            )
+        ]
+        return {
+            "pages": dict(window["pages"]),
+            "devices": dict(window["devices"]),
+            "categories": dict(window["categories"]),
+            "recent": recent,
+        }
+    
+    pages = dict(get_db().conn.execute(
+        "SELECT page, SUM(count) FROM visit_rollup GROUP BY page"
+    ).fetchall())
+    devices = dict(get_db().conn.execute(
+        "SELECT device_type, SUM(count) FROM visit_rollup GROUP BY device_type"
+    ).fetchall())
+    categories = dict(get_db().conn.execute(
+        "SELECT category, SUM(count) FROM visit_rollup "
+        "WHERE page = 'home' AND category != '' GROUP BY category"
+    ).fetchall())
+    recent = [
+        Visit(id=row[0], timestamp=row[1], page=row[2], category=row[3], device_type=row[4])
+        for row in get_db().conn.execute(
+            "SELECT id, timestamp, page, category, device_type FROM visit "
+            "ORDER BY timestamp DESC LIMIT ?", (recent_limit,)
+        )
+    ]
+    return {"pages": pages, "devices": devices, "categories": categories, "recent": recent}
+
+@rt("/api/visits")
+def visits_api(request, bucket: str = "hour"):
+    """Visit counts for a from/to window grouped into minute/hour/day buckets"""
+    if bucket not in VISIT_BUCKETS:
+        return JSONResponse({"error": f"bucket must be one of {', '.join(VISIT_BUCKETS)}"}, status_code=400)
+    try:
+        start, end = parse_visit_window(request.query_params.get("from"), request.query_params.get("to"))
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return visit_window(start, end, bucket)
+
+# Most riders a search returns
+SEARCH_MAX_RESULTS = 50
+
+@rt("/api/search")
+def search_api(q: str = "", season: str = None, limit: int = 20):
+    """Riders of a season by race number or by a prefix of their first or last name"""
+    season = resolve_season(season)
+    riders = rider_search.search(season, q, min(max(limit, 1), SEARCH_MAX_RESULTS))
+    if riders is None:
+        return JSONResponse({"error": "unknown season"}, status_code=404)
+    return {"season": season, "query": q, "riders": riders}
+
+# Standings API formats and their media types
+API_FORMATS = {
+    "json": "application/json",
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+# Category name that exports every category of a season in one stream
+API_ALL_CATEGORIES = "all"
+
+def api_standings_frame(df, fields=None, races=None, partial=False):
+    """A category's standings restricted to some races and fields.
+
+    Races (with or without the Race_ prefix) keep only those race columns
+    and the riders who scored in at least one of them. Raises ValueError
+    for unknown races or fields; with partial (one category of several)
+    those are skipped instead, and None is returned when the category
+    held none of the races.
+    """
+    race_cols = get_race_columns(df)
+    if races:
+        wanted = [race if race.startswith("Race_") else f"Race_{race}" for race in races]
+        unknown = [race for race in wanted if race not in race_cols]
+        if unknown and not partial:
+            raise ValueError(f"unknown race: {', '.join(unknown)}")
+        wanted = [race for race in wanted if race in race_cols]
+        if not wanted:
+            return None
+        scores = df[wanted].apply(pd.to_numeric, errors="coerce")
+        df = df[(scores.notna() & (scores != 0)).any(axis=1)]
+        race_cols = wanted
+    columns = [column for column in STANDINGS_COLUMNS if column in df] + race_cols
+    if fields:
+        unknown = [field for field in fields if field not in columns]
+        if unknown and not partial:
+            raise ValueError(f"unknown field: {', '.join(unknown)}")
+        columns = [field for field in fields if field in columns]
+    return df[columns]
+
+def api_records(frame, category=None):
+    """Yield a frame's rows as dicts of plain values (None when missing), optionally tagged with their category"""
+    columns = list(frame.columns)
+    values = frame.astype(object).where(frame.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        record = dict(zip(columns, row))
+        if category is not None:
+            record = {"Category": category, **record}
+        yield record
+
+def serialize_records(records, columns, fmt):
+    """Yield the text of a JSON array, CSV table or NDJSON stream one record at a time"""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for record in records:
+            writer.writerow("" if record.get(column) is None else record[column] for column in columns)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue()
+    elif fmt == "ndjson":
+        for record in records:
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+    else:
+        yield "["
+        for i, record in enumerate(records):
+            yield ("," if i else "") + json.dumps(record, ensure_ascii=False)
+        yield "]"
+
+def _api_stream(frames, fmt):
+    """Records of several categories' frames, serialized row by row as they are sent"""
+    # Categories can have different races; the CSV header covers them all
+    columns = ["Category"]
+    for _, frame in frames:
+        columns.extend(column for column in frame.columns if column not in columns)
+    records = (record for category, frame in frames for record in api_records(frame, category))
+    for chunk in serialize_records(records, columns, fmt):
+        yield chunk.encode("utf-8")
+
+@rt("/api/standings/{category}")
+def standings_api(request, category: str, season: str = None, format: str = "json",
+                  fields: str = None, race: str = None):
+    """A category's standings as JSON, CSV or NDJSON, optionally narrowed to some fields and races.
+
+    `all` exports every category of the season, streamed row by row.
+    """
+    if format not in API_FORMATS:
+        return JSONResponse({"error": f"format must be one of {', '.join(API_FORMATS)}"}, status_code=400)
+    if category != API_ALL_CATEGORIES and category not in CATEGORIES:
+        return JSONResponse({"error": "unknown category"}, status_code=404)
+    season = resolve_season(season)
+    store = season_catalog.get(season)
+    if store is None:
+        return JSONResponse({"error": "unknown season"}, status_code=404)
+    fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    races = [r.strip() for r in race.split(",") if r.strip()] if race else None
+    
+    if category == API_ALL_CATEGORIES:
+        # Select up front: errors can't be reported once streaming starts.
+        # Categories that didn't hold a race (or lack a race field) just
+        # contribute nothing; only names no category knows are errors
+        current = {c: store.get_with_version(c) for c in CATEGORIES}
+        available = [(c, df) for c, (df, _) in current.items() if df is not None]
+        known = {column for _, df in available for column in [*STANDINGS_COLUMNS, *get_race_columns(df)]}
+        unknown_races = [r for r in (r if r.startswith("Race_") else f"Race_{r}" for r in races or ()) if r not in known]
+        unknown_fields = [f for f in fields or () if f not in known]
+        if unknown_races or unknown_fields:
+            error = f"unknown race: {', '.join(unknown_races)}" if unknown_races else f"unknown field: {', '.join(unknown_fields)}"
+            return JSONResponse({"error": error}, status_code=400)
+        frames = [(c, frame) for c, df in available
+                  if (frame := api_standings_frame(df, fields, races, partial=True)) is not None]
+        version = hashlib.sha1(repr([v for _, v in current.values()]).encode()).hexdigest()[:16]
+        headers = page_cache_headers(season, category, version, store.newest_modified())
+        headers["ETag"] = f'"api-{format}-{headers["ETag"][1:]}'
+        if is_not_modified(request, headers):
+            return Response(status_code=304, headers=headers)
+        return StreamingResponse(_api_stream(frames, format),
+                                 media_type=API_FORMATS[format], headers=headers)
+    
+    df, version = store.get_with_version(category)
+    if df is None:
+        return JSONResponse({"error": "no data for this category"}, status_code=404)
+    try:
+        frame = api_standings_frame(df, fields, races)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    # Serialized bodies are cached per data version like rendered pages
+    return cached_response(
+        request, f"api-{format}", season, category, version,
+        lambda: "".join(serialize_records(api_records(frame), list(frame.columns), format)),
+        extra=(tuple(fields or ()), tuple(races or ())), media_type=API_FORMATS[format],
+    )
+
 @rt("/stats")
 def stats(request):
     """Statistics page showing visit analytics"""
@@ -312,27 +2176,38 @@ def stats(request):
     user_agent = request.headers.get('user-agent', '')
     track_visit("stats", "", user_agent)
     
-    # Get all visits
-    all_visits = list(visits_table())
-    total_visits = len(all_visits)
+    # Optional time window filter (defaults to all-time totals)
+    window_from = request.query_params.get("from", "")
+    window_to = request.query_params.get("to", "")
+    start = end = None
+    if window_from or window_to:
+        try:
+            start, end = parse_visit_window(window_from or None, window_to or None)
+        except ValueError:
+            start = end = None
+    
+    return render_stats_page(start, end)
+
+def render_stats_page(start=None, end=None):
+    """Build the visit statistics page, optionally restricted to a time window"""
+    # Aggregate visits in SQLite
+    summary = visit_summary(start=start, end=end)
+    page_counts = summary["pages"]
+    device_counts = summary["devices"]
+    category_counts = summary["categories"]
+    recent_visits = summary["recent"]
+    total_visits = sum(page_counts.values())
     
     # Count visits by page
-    home_visits = sum(1 for v in all_visits if v.page == 'home')
-    stats_visits = sum(1 for v in all_visits if v.page == 'stats')
+    home_visits = page_counts.get('home', 0)
+    stats_visits = page_counts.get('stats', 0)
+    rider_visits = page_counts.get('rider', 0)
+    progression_visits = page_counts.get('progression', 0)
     
     # Count visits by device type
-    mobile_visits = sum(1 for v in all_visits if getattr(v, 'device_type', 'unknown') == 'mobile')
-    desktop_visits = sum(1 for v in all_visits if getattr(v, 'device_type', 'unknown') == 'desktop')
-    unknown_visits = sum(1 for v in all_visits if getattr(v, 'device_type', 'unknown') == 'unknown')
-    
-    # Count visits by category
-    category_counts = {}
-    for v in all_visits:
-        if v.page == 'home' and v.category:
-            category_counts[v.category] = category_counts.get(v.category, 0) + 1
-    
-    # Get recent visits (last 20)
-    recent_visits = sorted(all_visits, key=lambda x: x.timestamp, reverse=True)[:20]
+    mobile_visits = device_counts.get('mobile', 0)
+    desktop_visits = device_counts.get('desktop', 0)
+    unknown_visits = device_counts.get('unknown', 0)
     
     # Create category stats rows
     category_rows = []
@@ -364,7 +2239,7 @@ def stats(request):
         except:
             time_str = visit.timestamp
         
-        page_display = "🏠 Home" if visit.page == 'home' else "📊 Stats"
+        page_display = VISIT_PAGES.get(visit.page, visit.page)
         category_display = CATEGORIES.get(visit.category, visit.category) if visit.category else "—"
         
         # Get device type with fallback for old records
@@ -390,55 +2265,7 @@ def stats(request):
         )
     
     return Html(
-        Head(
-            Title("Visit Statistics - BGX Navigation Championship"),
-            Meta(charset="utf-8"),
-            Meta(name="viewport", content="width=device-width, initial-scale=1"),
-            Script(src="https://cdn.tailwindcss.com"),
-            Script("""
-                tailwind.config = {
-                    theme: {
-                        extend: {
-                            colors: {
-                                primary: '#2563eb',
-                                secondary: '#7c3aed',
-                            }
-                        }
-                    }
-                }
-            """),
-            Style("""
-                @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap');
-                
-                * {
-                    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-                }
-                
-                body {
-                    background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-                }
-                
-                .gradient-text {
-                    background: linear-gradient(135deg, #2563eb, #7c3aed);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    background-clip: text;
-                }
-                
-                .gradient-bg {
-                    background: linear-gradient(135deg, #2563eb, #7c3aed);
-                }
-                
-                @keyframes fadeIn {
-                    from { opacity: 0; transform: translateY(10px); }
-                    to { opacity: 1; transform: translateY(0); }
-                }
-                
-                .animate-fade-in {
-                    animation: fadeIn 0.5s ease-out;
-                }
-            """)
-        ),
+        page_head("Visit Statistics - BGX Navigation Championship"),
         Body(
             # Header Section
             Div(
@@ -461,6 +2288,24 @@ def stats(request):
                 cls="text-center py-12 px-4"
             ),
             
+            # Time Window Filter
+            Div(
+                Form(
+                    Label("From", cls="text-sm uppercase tracking-wider text-slate-400 font-semibold"),
+                    Input(type="datetime-local", name="from", value=start.isoformat(timespec="minutes") if start else "",
+                          cls="px-3 py-2 bg-slate-800 text-slate-200 border border-slate-700 rounded-lg"),
+                    Label("To", cls="text-sm uppercase tracking-wider text-slate-400 font-semibold"),
+                    Input(type="datetime-local", name="to", value=end.isoformat(timespec="minutes") if end else "",
+                          cls="px-3 py-2 bg-slate-800 text-slate-200 border border-slate-700 rounded-lg"),
+                    Button("Apply", type="submit",
+                           cls="px-6 py-2 gradient-bg text-white rounded-lg font-semibold hover:scale-105 transition-all duration-200"),
+                    A("All time", href="/stats", cls="px-4 py-2 text-slate-400 hover:text-slate-100"),
+                    method="get", action="/stats",
+                    cls="flex flex-wrap items-center justify-center gap-3"
+                ),
+                cls="max-w-7xl mx-auto px-4 pb-8"
+            ),
+            
             # Stats Cards
             Div(
                 Div(
@@ -491,7 +2336,25 @@ def stats(request):
                         ),
                         cls="bg-slate-800 rounded-xl p-8 border border-slate-700 shadow-lg"
                     ),
-                    cls="grid grid-cols-1 md:grid-cols-3 gap-6"
+                    Div(
+                        Div(
+                            Span("🏍️", cls="text-4xl mb-3"),
+                            Div(str(rider_visits), cls="text-4xl font-bold text-slate-100"),
+                            Div("Rider Page Visits", cls="text-sm uppercase tracking-wider text-slate-400 font-semibold mt-2"),
+                            cls="text-center"
+                        ),
+                        cls="bg-slate-800 rounded-xl p-8 border border-slate-700 shadow-lg"
+                    ),
+                    Div(
+                        Div(
+                            Span("🏁", cls="text-4xl mb-3"),
+                            Div(str(progression_visits), cls="text-4xl font-bold text-slate-100"),
+                            Div("Progression Page Visits", cls="text-sm uppercase tracking-wider text-slate-400 font-semibold mt-2"),
+                            cls="text-center"
+                        ),
+                        cls="bg-slate-800 rounded-xl p-8 border border-slate-700 shadow-lg"
+                    ),
+                    cls="grid grid-cols-1 md:grid-cols-3 lg:grid-cols-5 gap-6"
                 ),
                 cls="max-w-7xl mx-auto px-4 pb-8"
             ),
@@ -621,40 +2484,184 @@ def stats(request):
         )
     )
 
+def _text(body):
+    return body if isinstance(body, str) else to_xml(body)
+
+def cached_response(request, kind, season, category, version, render, extra=(),
+                    media_type="text/html; charset=utf-8", data_modified=None, cache=None):
+    """Conditional, precompressed response for a rendered view of a season's category.
+
+    `render` builds the markup (or any other text body); its bytes (and
+    each compressed variant) are cached per data version and `extra` (such
+    as the leaderboard window) in `cache` (render_cache by default). Views
+    link to the other seasons, so they also depend on the season list.
+    """
+    # Each content coding is its own representation with its own ETag
+    encoding = choose_encoding(request)
+    headers = page_cache_headers(season, category, version, data_modified)
+    headers["Vary"] = "Accept-Encoding"
+    if kind != "page":
+        headers["ETag"] = f'"{kind}-{headers["ETag"][1:]}'
+    if encoding:
+        headers["ETag"] = f'{headers["ETag"][:-1]}-{encoding}"'
+    
+    # Let the client reuse its copy when neither data nor template changed
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    
+    cache = cache or render_cache
+    catalog_version = (season_catalog.version(), *extra)
+    body = cache.get_or_render(
+        kind, (season, category), version, lambda: _text(render()), extra=catalog_version,
+    )
+    if encoding:
+        body = cache.get_or_render(
+            f"{kind}.{encoding}", (season, category), version, lambda: compress(body, encoding),
+            extra=catalog_version,
+        )
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type=media_type, headers=headers)
+
 @rt("/")
-def get(request, category: str = "expert"):
+def get(request, category: str = "expert", season: str = None, offset: int = 0, limit: int = None):
     """Main page route with Tailwind styling"""
     # Track this visit
     user_agent = request.headers.get('user-agent', '')
     track_visit("home", category, user_agent)
     
-    # Load data for selected category
-    df = load_category_data(category)
+    # Load data for selected season and category
+    season = resolve_season(season)
+    store = season_catalog.get(season)
+    if store is None:
+        return Response("Unknown season", status_code=404)
+    df, version = store.get_with_version(category)
     
-    # Calculate some stats
-    total_riders = len(df) if df is not None else 0
-    total_races = len(get_race_columns(df)) if df is not None else 0
+    # Serve the prerendered (and precompressed) page when the data hasn't changed
+    offset, limit = leaderboard_window(offset, limit, len(df) if df is not None else 0)
+    return cached_response(
+        request, "page", season, category, version,
+        lambda: render_home_page(df, category, version, season, live=True, offset=offset, limit=limit),
+        extra=(offset, limit),
+    )
+
+@rt("/leaderboard")
+def leaderboard(request, category: str = "expert", season: str = None):
+    """Category view fragment the page's tabs swap in, instead of a full page load"""
+    # A tab switch is a category view like any other
+    user_agent = request.headers.get('user-agent', '')
+    track_visit("home", category, user_agent)
+    
+    season = resolve_season(season)
+    store = season_catalog.get(season)
+    if store is None:
+        return Response("Unknown season", status_code=404)
+    df, version = store.get_with_version(category)
+    
+    return cached_response(
+        request, "fragment", season, category, version,
+        lambda: render_category_fragment(df, category, version, season),
+    )
+
+@rt("/leaderboard/rows")
+def leaderboard_rows(request, category: str = "expert", season: str = None, offset: int = 0, limit: int = None):
+    """Next window of leaderboard rows, appended as the visitor scrolls"""
+    season = resolve_season(season)
+    store = season_catalog.get(season)
+    if store is None:
+        return Response("Unknown season", status_code=404)
+    df, version = store.get_with_version(category)
+    offset, limit = leaderboard_window(offset, limit, len(df) if df is not None else 0)
+    
+    return cached_response(
+        request, "rows", season, category, version,
+        lambda: "".join(leaderboard_window_rows(df, category, season, offset, limit)) if df is not None else "",
+        extra=(offset, limit),
+    )
+
+def page_url(category, season):
+    """Link to a category page; the default season keeps the short /?category= form"""
+    if season == resolve_season():
+        return f"/?category={category}"
+    return f"/?season={season}&category={category}"
+
+def stat_value(key, value):
+    """Big number in the stats grid; addressable (stat-<key>) for live updates"""
+    return Div(str(value), id=f"stat-{key}", cls="text-3xl font-bold text-slate-100")
+
+def render_category_nav(category, season, live=False):
+    """Season switcher and category tabs for a season's category.
+
+    On live pages the tabs swap in the category view fragment with htmx
+    (pushing the page URL) instead of loading the whole page again.
+    """
+    # Season switcher, only once there is more than one season to pick
+    season_links = []
+    seasons = season_catalog.seasons()
+    if len(seasons) > 1:
+        for year in seasons:
+            if year == season:
+                season_links.append(
+                    A(year, href=page_url(category, year),
+                      cls="px-4 py-2 gradient-bg text-white rounded-lg font-semibold shadow-lg")
+                )
+            else:
+                season_links.append(
+                    A(year, href=page_url(category, year),
+                      cls="px-4 py-2 bg-slate-800 text-slate-300 border border-slate-700 rounded-lg font-semibold hover:border-blue-500 hover:text-slate-100 transition-all duration-200")
+                )
     
     # Create category tabs with Tailwind styling
     tabs = []
     for cat_key, cat_name in CATEGORIES.items():
+        swap = dict(
+            hx_get=f"/leaderboard?season={season}&category={cat_key}",
+            hx_target="#category-view", hx_swap="outerHTML", hx_push_url=page_url(cat_key, season),
+        ) if live else {}
         if cat_key == category:
             tabs.append(
                 A(
                     cat_name, 
-                    href=f"/?category={cat_key}", 
-                    cls="px-6 py-3 gradient-bg text-white rounded-lg font-semibold shadow-lg transform hover:scale-105 transition-all duration-200"
+                    href=page_url(cat_key, season), 
+                    cls="px-6 py-3 gradient-bg text-white rounded-lg font-semibold shadow-lg transform hover:scale-105 transition-all duration-200",
+                    **swap
                 )
             )
         else:
             tabs.append(
                 A(
                     cat_name, 
-                    href=f"/?category={cat_key}", 
-                    cls="px-6 py-3 bg-slate-800 text-slate-300 border-2 border-slate-700 rounded-lg font-semibold hover:border-blue-500 hover:bg-blue-500/10 hover:text-slate-100 transform hover:-translate-y-0.5 transition-all duration-200"
+                    href=page_url(cat_key, season), 
+                    cls="px-6 py-3 bg-slate-800 text-slate-300 border-2 border-slate-700 rounded-lg font-semibold hover:border-blue-500 hover:bg-blue-500/10 hover:text-slate-100 transform hover:-translate-y-0.5 transition-all duration-200",
+                    **swap
                 )
             )
     
+    return (
+        # Season Switcher
+        Div(
+            *season_links,
+            id="season-links",
+            cls="flex flex-wrap justify-center gap-2 max-w-5xl mx-auto mb-6 px-4"
+        ) if season_links else "",
+        # Category Tabs
+        Div(
+            *tabs, 
+            id="category-tabs",
+            cls="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-3 max-w-5xl mx-auto mb-8 px-4"
+        ),
+    )
+
+def render_category_view(df, category, version, season, live=False, offset=0, limit=None):
+    """Stats grid and leaderboard for a category: the part of the page a tab switch replaces.
+
+    A live view shows a window of the leaderboard (the first page unless
+    asked otherwise) and subscribes to /live, which pushes the rows that
+    change when the category's standings are updated.
+    """
+    # Calculate some stats
+    total_riders = len(df) if df is not None else 0
+    total_races = len(get_race_columns(df)) if df is not None else 0
+    
     # Stats with Tailwind styling
     stats = Div(
         Div(
@@ -662,7 +2669,7 @@ def get(request, category: str = "expert"):
             Div(
                 Div(
                     Span("👥", cls="text-3xl mb-2"),
-                    Div(str(total_riders), cls="text-3xl font-bold text-slate-100"),
+                    stat_value("riders", total_riders),
                     Div("Total Riders", cls="text-xs uppercase tracking-wider text-slate-400 font-semibold mt-1"),
                     cls="text-center"
                 ),
@@ -672,7 +2679,7 @@ def get(request, category: str = "expert"):
             Div(
                 Div(
                     Span("🏁", cls="text-3xl mb-2"),
-                    Div(str(total_races), cls="text-3xl font-bold text-slate-100"),
+                    stat_value("races", total_races),
                     Div("Total Races", cls="text-xs uppercase tracking-wider text-slate-400 font-semibold mt-1"),
                     cls="text-center"
                 ),
@@ -693,93 +2700,66 @@ def get(request, category: str = "expert"):
         cls="max-w-7xl mx-auto px-4 pb-8"
     )
     
-    return Html(
-        Head(
-            Title("BGX Hard Enduro Championship 2025 (Unofficial)"),
-            Meta(charset="utf-8"),
-            Meta(name="viewport", content="width=device-width, initial-scale=1"),
-            Script(src="https://cdn.tailwindcss.com"),
-            Script("""
-                tailwind.config = {
-                    theme: {
-                        extend: {
-                            colors: {
-                                primary: '#2563eb',
-                                secondary: '#7c3aed',
-                            }
-                        }
-                    }
-                }
-            """),
-            Style("""
-                @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800;900&display=swap');
-                
-                * {
-                    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-                }
-                
-                body {
-                    background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-                }
-                
-                .gradient-text {
-                    background: linear-gradient(135deg, #2563eb, #7c3aed);
-                    -webkit-background-clip: text;
-                    -webkit-text-fill-color: transparent;
-                    background-clip: text;
-                }
-                
-                .gradient-bg {
-                    background: linear-gradient(135deg, #2563eb, #7c3aed);
-                }
-                
-                .position-badge-1 {
-                    background: linear-gradient(135deg, #fbbf24, #f59e0b);
-                }
-                
-                .position-badge-2 {
-                    background: linear-gradient(135deg, #e2e8f0, #94a3b8);
-                }
-                
-                .position-badge-3 {
-                    background: linear-gradient(135deg, #f97316, #ea580c);
-                }
-                
-                @keyframes fadeIn {
-                    from { opacity: 0; transform: translateY(10px); }
-                    to { opacity: 1; transform: translateY(0); }
-                }
-                
-                .animate-fade-in {
-                    animation: fadeIn 0.5s ease-out;
-                }
-            """)
+    # Live updates arrive as htmx out-of-band swaps; the version lets /live
+    # resync a client whose page is already out of date
+    subscription = Div(
+        Div(sse_swap="rows", hx_swap="none"),
+        hx_ext="sse", sse_connect=f"/live?season={season}&category={category}&version={version}",
+        cls="hidden"
+    ) if live else ""
+    
+    return Div(
+        # Stats Section
+        stats,
+        # The progression page is served by the app only, not the static export
+        Div(
+            A("📈 Championship progression →", href=f"/progression?season={season}&category={category}",
+              cls="text-blue-400 font-semibold hover:text-blue-300"),
+            cls="max-w-7xl mx-auto px-4 pb-4 text-right"
+        ) if live else "",
+        # Leaderboard Section
+        Div(
+            NotStr(render_leaderboard_table(df, category, version, season, offset, limit).decode("utf-8")),
+            id="leaderboard",
+            cls="max-w-7xl mx-auto px-4 pb-12"
         ),
+        subscription,
+        id="category-view"
+    )
+
+def render_category_view_html(df, category, version, season, live=False, offset=0, limit=None):
+    """Rendered HTML for a category view, cached per data version"""
+    return render_cache.get_or_render(
+        "view", (season, category), version,
+        lambda: to_xml(render_category_view(df, category, version, season, live, offset, limit)),
+        extra=(live, offset, limit),
+    )
+
+def render_home_page(df, category, version, season, live=False, offset=0, limit=None):
+    """Build the full leaderboard page for a season's category.
+
+    Live pages (the ones the app serves, as opposed to the static export)
+    load htmx for in-place tab switches and live updates.
+    """
+    scripts = (Script(src=HTMX_URL, defer=True), Script(src=HTMX_SSE_URL, defer=True)) if live else ()
+    
+    return Html(
+        page_head(f"BGX Hard Enduro Championship {season} (Unofficial)", *scripts),
         Body(
             # Header Section
             Div(
                 H1(
-                    "🏆 BGX Hard Enduro Championship 2025 (Unofficial)",
+                    f"🏆 BGX Hard Enduro Championship {season} (Unofficial)",
                     cls="text-4xl md:text-5xl lg:text-6xl font-black gradient-text mb-3"
                 ),
                 P(
-                    "BGX Hard Enduro Championship 2025 Results from first navigation day",
+                    f"BGX Hard Enduro Championship {season} Results from first navigation day",
                     cls="text-slate-400 text-lg md:text-xl"
                 ),
                 cls="text-center py-12 px-4"
             ),
-            # Category Tabs
-            Div(
-                *tabs, 
-                cls="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-3 max-w-5xl mx-auto mb-8 px-4"
-            ),
-            # Stats Section
-            stats,
-            # Leaderboard Section
-            Div(
-                create_leaderboard_table(df, category),
-                cls="max-w-7xl mx-auto px-4 pb-12"
-            ),
+            *render_category_nav(category, season, live),
+            NotStr(render_category_view_html(df, category, version, season, live, offset, limit).decode("utf-8")),
             # Footer
             Div(
                 Div(
@@ -795,10 +2775,598 @@ def get(request, category: str = "expert"):
         )
     )
 
+def render_category_fragment(df, category, version, season):
+    """Tab switch response: the category view plus the tabs, swapped out of band"""
+    nav = "".join(to_xml(part(hx_swap_oob="true")) for part in render_category_nav(category, season, live=True) if part)
+    offset, limit = leaderboard_window()
+    return render_category_view_html(df, category, version, season, True, offset, limit).decode("utf-8") + nav
+
+@rt("/rider/{number}")
+def rider(request, number: int, season: str = None):
+    """Rider profile: results and standing after each round, in every category they ride"""
+    user_agent = request.headers.get('user-agent', '')
+    track_visit("rider", "", user_agent)
+    
+    season = resolve_season(season)
+    index = rider_search.index(season)
+    if index is None:
+        return Response("Unknown season", status_code=404)
+    entries = index.rider(number)
+    if not entries:
+        return Response("Unknown rider", status_code=404)
+    
+    # Profiles depend on every category the rider could appear in
+    return cached_response(
+        request, "rider", season, str(number), index.version,
+        lambda: render_rider_page(number, entries, season),
+        data_modified=season_catalog.get(season).newest_modified(), cache=profile_cache,
+    )
+
+def rider_category_card(record, row, season):
+    """One category of a rider profile: summary stats and a row per round"""
+    store = season_catalog.get(season)
+    category = record["category"]
+    df, progression, _ = store.progression_with_version(category)
+    leader_total = df["TotalPoints"].max()
+    
+    th = "text-center px-3 py-3 text-slate-400 uppercase text-xs font-semibold tracking-wider border-b-2 border-slate-700"
+    rounds = []
+    for j, race_col in enumerate(progression.races):
+        points = progression.points[row, j]
+        if np.isnan(points) or points == 0:
+            score = Td("—", cls="text-center px-3 py-4 text-slate-500")
+        else:
+            tier = "top" if points >= 25 else "regular"
+            score = Td(Span(f"{points:.0f}", cls=SCORE_TIER_CLASSES[tier]), cls="text-center px-3 py-4")
+        gap = progression.gap[row, j]
+        rounds.append(Tr(
+            Td(format_race_name(race_col), cls="px-3 py-4 text-slate-200"),
+            score,
+            Td(f"{progression.cumulative[row, j]:.0f}", cls="text-center px-3 py-4 text-slate-200 font-semibold"),
+            Td(create_position_badge(int(progression.rank[row, j])), cls="text-center px-3 py-4"),
+            Td(f"−{gap:.0f}" if gap else "—", cls="text-center px-3 py-4 text-slate-300"),
+            cls="border-b border-slate-700/50 hover:bg-blue-500/5 transition-colors duration-200"
+        ))
+    
+    def summary(label, value):
+        return Div(
+            Div(str(value), cls="text-3xl font-bold text-slate-100"),
+            Div(label, cls="text-xs uppercase tracking-wider text-slate-400 font-semibold mt-1"),
+            cls="bg-slate-900/50 rounded-xl p-4 border border-slate-700 text-center"
+        )
+    total = record["total_points"] or 0
+    
+    return Div(
+        Div(
+            Div(
+                H2(A(f"{record['category_name']}", href=page_url(category, season), cls="hover:text-blue-300"),
+                   cls="text-2xl font-bold text-slate-100"),
+                cls="px-6 py-5 bg-gradient-to-r from-blue-500/10 to-purple-500/10 border-b border-slate-700"
+            ),
+            Div(
+                summary("Position", record["position"]),
+                summary("Total Points", f"{total:.0f}"),
+                summary("Best Pos", record["best_position"]),
+                summary("Gap to Leader", f"{leader_total - total:.0f}"),
+                cls="grid grid-cols-2 md:grid-cols-4 gap-4 p-6"
+            ),
+            Div(
+                Table(
+                    Thead(Tr(
+                        Th("Round", cls=th.replace("text-center ", "")),
+                        Th("Points", cls=th),
+                        Th("Total", cls=th),
+                        Th("Rank", cls=th),
+                        Th("Gap to Leader", cls=th),
+                    ), cls="bg-blue-500/5"),
+                    Tbody(*rounds),
+                    cls="w-full border-collapse"
+                ),
+                cls="w-full overflow-x-auto"
+            ),
+            cls="bg-slate-800 rounded-xl shadow-2xl border border-slate-700 overflow-hidden animate-fade-in"
+        ),
+        cls="max-w-5xl mx-auto px-4 pb-8"
+    )
+
+def render_rider_page(number, entries, season):
+    """Build a rider's profile page from their search index entries.
+
+    The last round's row is the final standings, which the summary repeats.
+    """
+    first = entries[0][0]
+    name = f"{first['first_name']} {first['last_name']}"
+    return Html(
+        page_head(f"#{number} {name} · BGX Hard Enduro Championship {season}"),
+        Body(
+            # Header Section
+            Div(
+                H1(
+                    f"#{number} {name}",
+                    cls="text-4xl md:text-5xl lg:text-6xl font-black gradient-text mb-3"
+                ),
+                P(
+                    f"BGX Hard Enduro Championship {season} (Unofficial)",
+                    cls="text-slate-400 text-lg md:text-xl"
+                ),
+                cls="text-center py-12 px-4"
+            ),
+            *[rider_category_card(record, row, season) for record, row in entries],
+            # Footer
+            Div(
+                Div(
+                    A("← Back to leaderboard", href=page_url(first["category"], season),
+                      cls="text-blue-400 font-semibold hover:text-blue-300"),
+                    cls="max-w-5xl mx-auto px-4 py-6"
+                ),
+                cls="border-t border-slate-700/50"
+            ),
+            cls="min-h-screen py-8"
+        )
+    )
+
+@rt("/progression")
+def progression(request, category: str = "expert", season: str = None):
+    """How a category's standings evolved round by round"""
+    season = resolve_season(season)
+    store = season_catalog.get(season)
+    if store is None:
+        return Response("Unknown season", status_code=404)
+    if category not in CATEGORIES:
+        return Response("Unknown category", status_code=404)
+    user_agent = request.headers.get('user-agent', '')
+    track_visit("progression", category, user_agent)
+    df, progression, version = store.progression_with_version(category)
+    
+    return cached_response(
+        request, "progression", season, category, version,
+        lambda: render_progression_page(df, progression, category, season),
+    )
+
+def movement_marker(change):
+    """Up/down arrow with the number of places gained or lost since the previous round"""
+    if change > 0:
+        return Span(f"▲{change}", cls="text-green-400 text-xs font-semibold")
+    if change < 0:
+        return Span(f"▼{-change}", cls="text-red-400 text-xs font-semibold")
+    return Span("–", cls="text-slate-500 text-xs")
+
+def create_progression_table(df, progression, category, season):
+    """Riders (in their latest order) against rounds: rank, movement and running total"""
+    if df is None or df.empty or not progression.races:
+        return Div(
+            P("No data available for this category.", cls="text-center text-slate-400 p-8"),
+            cls="bg-slate-800 rounded-xl shadow-2xl border border-slate-700"
+        )
+    
+    th = "text-center px-3 py-3 text-slate-400 uppercase text-xs font-semibold tracking-wider border-b-2 border-slate-700"
+    headers = [Th("Rider", cls=th.replace("text-center ", ""))]
+    headers.extend(Th(format_race_name(race_col), cls=th) for race_col in progression.races)
+    
+    numbers = df["RaceNumber"].astype(int).tolist()
+    names = (df["FirstName"].astype(str) + " " + df["LastName"].astype(str)).tolist()
+    rows = []
+    for i in np.argsort(df["FinalPosition"].to_numpy(), kind="stable"):
+        cells = [Td(
+            A(Strong(f"#{numbers[i]}"), f" {names[i]}", href=f"/rider/{numbers[i]}?season={season}",
+              cls="hover:text-blue-300"),
+            cls="px-3 py-4 text-slate-200 min-w-[180px]"
+        )]
+        for j in range(len(progression.races)):
+            cells.append(Td(
+                Div(str(progression.rank[i, j]), " ",
+                    movement_marker(progression.movement[i, j]) if j else "",
+                    cls="font-bold text-slate-100"),
+                Div(f"{progression.cumulative[i, j]:.0f} pts", cls="text-xs text-slate-400"),
+                cls="text-center px-3 py-4"
+            ))
+        rows.append(Tr(*cells, cls="border-b border-slate-700/50 hover:bg-blue-500/5 transition-colors duration-200"))
+    
+    return Div(
+        Div(
+            H2(f"{CATEGORIES[category]} Progression", cls="text-2xl font-bold text-slate-100"),
+            P("Rank after each round, places gained or lost since the round before, and running points. The last round is the final standings, with the worst result dropped.",
+              cls="text-slate-400 text-sm mt-1"),
+            cls="px-6 py-5 bg-gradient-to-r from-blue-500/10 to-purple-500/10 border-b border-slate-700"
+        ),
+        Div(
+            Table(
+                Thead(Tr(*headers), cls="bg-blue-500/5 sticky top-0 z-10"),
+                Tbody(*rows),
+                cls="w-full border-collapse"
+            ),
+            cls="w-full overflow-x-auto"
+        ),
+        cls="bg-slate-800 rounded-xl shadow-2xl border border-slate-700 overflow-hidden animate-fade-in"
+    )
+
+def render_progression_page(df, progression, category, season):
+    """Build the championship progression page for a season's category"""
+    tabs = []
+    for cat_key, cat_name in CATEGORIES.items():
+        if cat_key == category:
+            tabs.append(A(cat_name, href=f"/progression?season={season}&category={cat_key}",
+                          cls="px-6 py-3 gradient-bg text-white rounded-lg font-semibold shadow-lg"))
+        else:
+            tabs.append(A(cat_name, href=f"/progression?season={season}&category={cat_key}",
+                          cls="px-6 py-3 bg-slate-800 text-slate-300 border-2 border-slate-700 rounded-lg font-semibold hover:border-blue-500 hover:text-slate-100 transition-all duration-200"))
+    
+    return Html(
+        page_head(f"Championship Progression {season} · BGX Hard Enduro"),
+        Body(
+            # Header Section
+            Div(
+                H1(
+                    f"📈 Championship Progression {season}",
+                    cls="text-4xl md:text-5xl lg:text-6xl font-black gradient-text mb-3"
+                ),
+                P(
+                    A("← Back to leaderboard", href=page_url(category, season),
+                      cls="text-blue-400 font-semibold hover:text-blue-300"),
+                    cls="text-lg"
+                ),
+                cls="text-center py-12 px-4"
+            ),
+            # Category Tabs
+            Div(
+                *tabs,
+                cls="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-3 max-w-5xl mx-auto mb-8 px-4"
+            ),
+            Div(
+                create_progression_table(df, progression, category, season),
+                cls="max-w-7xl mx-auto px-4 pb-12"
+            ),
+            cls="min-h-screen py-8"
+        )
+    )
+
+# How often (seconds) categories with live subscribers are checked for new
+# standings, how many updates a subscriber may fall behind before it's
+# dropped (it reconnects and resyncs), and the keepalive for idle streams
+LIVE_CHECK_INTERVAL = float(os.getenv("LIVE_CHECK_INTERVAL", "1.0"))
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "16"))
+LIVE_KEEPALIVE = 15.0
+
+def _oob(row):
+    """Mark a rendered leaderboard row as an htmx out-of-band swap of its place"""
+    return row.replace("<tr ", '<tr hx-swap-oob="true" ', 1)
+
+def _live_table_message(df, category, version, season):
+    """SSE message replacing the whole table (first window) and its stats"""
+    offset, limit = leaderboard_window()
+    table = render_leaderboard_table(df, category, version, season, offset, limit).decode("utf-8")
+    html = (f'<div id="leaderboard" hx-swap-oob="innerHTML">{table}</div>'
+            + to_xml(stat_value("riders", len(df) if df is not None else 0)(hx_swap_oob="true"))
+            + to_xml(stat_value("races", len(get_race_columns(df)) if df is not None else 0)(hx_swap_oob="true")))
+    return sse_message(html, event="rows").encode("utf-8")
+
+def live_update_message(old, new, season, category):
+    """SSE message turning a page showing `old` (version, frame) into `new`.
+
+    Rows are compared place by place, so only the places whose markup
+    changed are sent, plus appended or deleted places when the table grew
+    or shrank. A change of race columns (or of data availability) resends
+    the whole table, as does a change in size of a table longer than one
+    window, since the server doesn't know how far each client has scrolled.
+    """
+    (_, old_df), (version, df) = old, new
+    if old_df is None or df is None or get_race_columns(old_df) != get_race_columns(df):
+        return _live_table_message(df, category, version, season)
+    
+    race_cols = get_race_columns(df)
+    old_rows = leaderboard_rows_html(leaderboard_display_columns(old_df, race_cols), race_cols)
+    rows = leaderboard_rows_html(leaderboard_display_columns(df, race_cols), race_cols)
+    if len(rows) != len(old_rows) and max(len(rows), len(old_rows)) > LEADERBOARD_PAGE_SIZE:
+        return _live_table_message(df, category, version, season)
+    # Table rows must travel inside <template> to survive HTML parsing;
+    # swaps of places a client hasn't loaded yet are ignored by htmx
+    swaps = [_oob(row) for row, old_row in zip(rows, old_rows) if row != old_row]
+    if len(rows) > len(old_rows):
+        swaps.append(f'<tbody hx-swap-oob="beforeend:#leaderboard-rows">{"".join(rows[len(old_rows):])}</tbody>')
+    swaps.extend(f'<tr id="lb-row-{place}" hx-swap-oob="delete"></tr>'
+                 for place in range(len(rows) + 1, len(old_rows) + 1))
+    html = f'<template>{"".join(swaps)}</template>' if swaps else ""
+    if len(rows) != len(old_rows):
+        html += to_xml(stat_value("riders", len(rows))(hx_swap_oob="true"))
+    return sse_message(html, event="rows").encode("utf-8")
+
+class LiveHub:
+    """Pushes standings changes to the live (SSE) subscribers of each category.
+
+    Every (season, category) with subscribers gets one watcher task in this
+    worker. When the category's data version changes, the watcher renders
+    the update once and puts the same encoded message on every subscriber's
+    queue, so a change costs one render however many clients are listening.
+    """
+
+    def __init__(self, check_interval=LIVE_CHECK_INTERVAL, queue_size=LIVE_QUEUE_SIZE):
+        self.check_interval = check_interval
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._watchers = {}
+        self._current = {}
+        self._resyncs = {}
+        self.messages = 0
+        self.deliveries = 0
+        self.dropped = 0
+        self.errors = 0
+
+    async def subscribe(self, season, category, version=None):
+        """Yield SSE messages for a category until the client goes away.
+
+        A client whose page shows an older version than the current one is
+        first sent the whole table.
+        """
+        key = (season, category)
+        inbox = asyncio.Queue(self.queue_size)
+        subscribers = self._subscribers.setdefault(key, set())
+        subscribers.add(inbox)
+        if key not in self._watchers:
+            self._watchers[key] = asyncio.create_task(self._watch(key))
+        try:
+            current = self._current.get(key) or await asyncio.to_thread(self._load, key)
+            if version is not None and version != (current[0] or "None"):
+                yield self._resync(key, current)
+            while inbox in subscribers:
+                try:
+                    yield await asyncio.wait_for(inbox.get(), LIVE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+        finally:
+            subscribers.discard(inbox)
+            if not subscribers:
+                del self._subscribers[key]
+                self._current.pop(key, None)
+                self._resyncs.pop(key, None)
+                self._watchers.pop(key).cancel()
+
+    def _resync(self, key, current):
+        """Whole-table message for the current version, built once per version"""
+        cached = self._resyncs.get(key)
+        if cached is None or cached[0] != current[0]:
+            cached = self._resyncs[key] = (current[0], live_update_message((None, None), current, *key))
+        return cached[1]
+
+    def _load(self, key):
+        season, category = key
+        store = season_catalog.get(season)
+        df, version = store.get_with_version(category) if store is not None else (None, None)
+        return version, df
+
+    async def _watch(self, key):
+        current = self._current[key] = await asyncio.to_thread(self._load, key)
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                latest = await asyncio.to_thread(self._load, key)
+                if latest[0] == current[0]:
+                    continue
+                message = await asyncio.to_thread(live_update_message, current, latest, *key)
+            except Exception:
+                # Keep the streams open; the next check retries
+                self.errors += 1
+                continue
+            current = self._current[key] = latest
+            self.broadcast(key, message)
+
+    def broadcast(self, key, message):
+        """Queue one prebuilt message for every subscriber of a category"""
+        self.messages += 1
+        subscribers = self._subscribers.get(key, ())
+        for inbox in list(subscribers):
+            try:
+                inbox.put_nowait(message)
+                self.deliveries += 1
+            except asyncio.QueueFull:
+                # Too far behind: end its stream so it reconnects and resyncs
+                subscribers.discard(inbox)
+                self.dropped += 1
+
+    def stats(self):
+        return {
+            "channels": len(self._subscribers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "messages": self.messages,
+            "deliveries": self.deliveries,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+live_hub = LiveHub()
+
+@rt("/live")
+async def live(category: str = "expert", season: str = None, version: str = None):
+    """Server-sent events stream of leaderboard updates for one category"""
+    season = resolve_season(season)
+    if season_catalog.get(season) is None or category not in CATEGORIES:
+        return Response("Unknown season or category", status_code=404)
+    return StreamingResponse(
+        live_hub.subscribe(season, category, version),
+        media_type="text/event-stream",
+        # Keep proxies (nginx) from buffering or caching the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# Static export: pages written for a plain file server such as nginx.
+# Categories live at category/<key>.html (index.html is the default
+# category), other seasons under season/<year>/, with optional .gz/.br
+# siblings for gzip_static/brotli_static.
+EXPORT_MANIFEST = ".export-manifest.json"
+DEFAULT_CATEGORY = "expert"
+
+def _write_page(path, body, precompress):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+    for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+        variant = path.with_name(path.name + suffix)
+        if precompress and encoding in PAGE_ENCODINGS:
+            variant.write_bytes(compress(body, encoding, best=True))
+        elif variant.exists():
+            variant.unlink()
+
+def export_dir(out_dir, season):
+    """Where a season's pages are exported"""
+    out_dir = Path(out_dir)
+    return out_dir if season == resolve_season() else out_dir / "season" / season
+
+def export_category(season, category, out_dir, precompress=False):
+    """Render one season's category page to out_dir; returns (season, category, data version)"""
+    store = season_catalog.get(season)
+    df, version = store.get_with_version(category)
+    body = to_xml(render_home_page(df, category, version, season)).encode("utf-8")
+    season_dir = export_dir(out_dir, season)
+    _write_page(season_dir / "category" / f"{category}.html", body, precompress)
+    if category == DEFAULT_CATEGORY:
+        _write_page(season_dir / "index.html", body, precompress)
+    return season, category, version
+
+def export_site(out_dir, precompress=False, workers=None, force=False):
+    """Prebuild every season's category pages plus a /stats snapshot into out_dir.
+
+    Pages render in parallel across a process pool. A manifest of the data
+    versions written last time lets unchanged pages be skipped unless the
+    template or season list changed, the compression setting changed or
+    force is set. Returns the list of (season, category) pages rendered.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / EXPORT_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    template = TEMPLATE_VERSION + season_catalog.version()
+    if force or manifest.get("template") != template or manifest.get("precompress") != precompress:
+        manifest = {"pages": {}}
+    
+    previous = manifest["pages"]
+    pending = []
+    for season in season_catalog.seasons():
+        store = season_catalog.get(season)
+        store.load_all()
+        for category in CATEGORIES:
+            if (previous.get(f"{season}/{category}") != store.version(category)
+                    or not (export_dir(out_dir, season) / "category" / f"{category}.html").exists()):
+                pending.append((season, category))
+    if pending:
+        seasons, categories = zip(*pending)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for season, category, version in pool.map(export_category, seasons, categories,
+                                                      [out_dir] * len(pending), [precompress] * len(pending)):
+                previous[f"{season}/{category}"] = version
+    
+    _write_page(out_dir / STYLESHEET_URL.lstrip("/"), STYLESHEET, precompress)
+    
+    # The stats page is a point-in-time snapshot, so it is always rebuilt
+    _write_page(out_dir / "stats.html", to_xml(render_stats_page()).encode("utf-8"), precompress)
+    
+    manifest.update(template=template, precompress=precompress, pages=previous)
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return pending
+
 if __name__ == "__main__":
-    import os
-    # Support environment variables for deployment
-    port = int(os.getenv("PORT", 5001))
-    host = os.getenv("HOST", "0.0.0.0")
-    serve(host=host, port=port)
+    import argparse
+    parser = argparse.ArgumentParser(description="BGX leaderboard server and maintenance commands")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("serve", help="Run the web server (default)")
+    commands.add_parser("migrate", help="Apply pending visit database migrations and exit")
+    commands.add_parser("backfill-rollups", help="Rebuild the visit rollup table from the raw visit table")
+    commands.add_parser("snapshot", help="Build columnar snapshots of the results CSVs")
+    standings = commands.add_parser("standings", help="Recompute the category CSVs from per-race results")
+    standings.add_argument("--season", default=None, help="Season to recompute (default: every season with races/)")
+    apply_race = commands.add_parser("apply-race", help="Publish one race's results for one category incrementally")
+    apply_race.add_argument("results", help="CSV with Position,RaceNumber,FirstName,LastName[,Points]")
+    apply_race.add_argument("--category", required=True, choices=CATEGORIES)
+    apply_race.add_argument("--race", required=True, help="Race name, e.g. kyrnare")
+    apply_race.add_argument("--season", default=None, help="Season (default: the current one)")
+    commands.add_parser("build-css", help="Rebuild static/app.css from static/app.src.css with the Tailwind CLI")
+    export = commands.add_parser("export", help="Prebuild every page as static HTML")
+    export.add_argument("--out", default="dist", help="Output directory (default: dist)")
+    export.add_argument("--compress", action="store_true", help="Also write .gz/.br variants")
+    export.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    export.add_argument("--force", action="store_true", help="Re-render categories even if unchanged")
+    compact = commands.add_parser("compact", help="Apply the raw visit retention policy once")
+    compact.add_argument("--days", type=int, default=VISIT_RETENTION_DAYS, help="Days of raw visits to keep")
+    compact.add_argument("--full-vacuum", action="store_true",
+                         help="Also run a full VACUUM (needed once to enable incremental vacuuming)")
+    args = parser.parse_args()
+    
+    # Migrate once here, before the server starts any workers
+    applied = migrate()
+    
+    if args.command == "migrate":
+        if applied:
+            print(f"Applied migrations {', '.join(map(str, applied))}; schema at version {SCHEMA_VERSION}")
+        else:
+            print(f"Schema already at version {SCHEMA_VERSION}")
+    elif args.command == "export":
+        rendered = export_site(args.out, precompress=args.compress, workers=args.workers, force=args.force)
+        skipped = len(season_catalog.seasons()) * len(CATEGORIES) - len(rendered)
+        print(f"Exported {len(rendered)} pages to {args.out} ({skipped} unchanged) plus stats.html")
+    elif args.command == "snapshot":
+        built = 0
+        for season in season_catalog.seasons():
+            store = season_catalog.get(season)
+            store.load_all()
+            built += store.snapshots.stats()["builds"]
+        print(f"Snapshots for {len(season_catalog.seasons())} seasons up to date in {SNAPSHOT_PATH} ({built} rebuilt)")
+    elif args.command == "standings":
+        seasons = season_catalog.seasons()
+        if args.season is not None and args.season not in seasons:
+            raise SystemExit(f"Unknown season {args.season}")
+        for season in [args.season] if args.season else seasons:
+            results = load_race_results(seasons[season])
+            if results is None:
+                print(f"{season}: no per-race results in {seasons[season] / 'races'}")
+                continue
+            # races/ may only hold the rounds added with apply-race
+            store = season_catalog.get(season)
+            scored = {col.removeprefix("Race_") for c in store.categories
+                      if (df := store.get(c)) is not None for col in df.columns if col.startswith("Race_")}
+            missing = sorted(scored - set(results["Race"]))
+            if missing:
+                print(f"{season}: skipped, no per-race results for {', '.join(missing)}")
+                continue
+            start = time.perf_counter()
+            computed = compute_standings(results)
+            elapsed = time.perf_counter() - start
+            write_standings(seasons[season], computed)
+            print(f"{season}: {len(computed)} categories from {results['Race'].nunique()} races "
+                  f"computed in {elapsed * 1000:.1f} ms")
+    elif args.command == "apply-race":
+        results = pd.read_csv(args.results)
+        if "Category" in results:
+            results = results[results["Category"] == args.category]
+        start = time.perf_counter()
+        try:
+            changed = apply_race_result(resolve_season(args.season), args.category, args.race, results)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        elapsed = time.perf_counter() - start
+        summary = ", ".join(f"{c} ({n} riders)" for c, n in changed.items()) or "nothing changed"
+        print(f"Applied {args.race} for {args.category} in {elapsed * 1000:.1f} ms: {summary}")
+    elif args.command == "build-css":
+        import subprocess
+        tailwind = shutil.which("tailwindcss")
+        if tailwind is None:
+            raise SystemExit("tailwindcss not found; install it with `pip install tailwindcss-bin`")
+        subprocess.run([tailwind, "-i", str(STATIC_PATH / "app.src.css"),
+                        "-o", str(STYLESHEET_PATH), "--minify"], check=True)
+    elif args.command == "backfill-rollups":
+        buckets = backfill_visit_rollups()
+        print(f"Rebuilt visit rollups: {buckets} buckets")
+    elif args.command == "compact":
+        migrate()
+        deleted = VisitRetention(DB_PATH, retention_days=args.days).run_once(force=True) if args.days > 0 else 0
+        print(f"Deleted {deleted} raw visits older than {args.days} days")
+        if args.full_vacuum:
+            full_vacuum()
+            print("Vacuumed database")
+    else:
+        # Support environment variables for deployment
+        port = int(os.getenv("PORT", 5001))
+        host = os.getenv("HOST", "0.0.0.0")
+        serve(host=host, port=port)
 